@@ -0,0 +1,59 @@
+"""Add indexes for foreign keys and filter columns
+
+Revision ID: 167e318d5be3
+Revises: f510e294b98a
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "167e318d5be3"
+down_revision: str | None = "f510e294b98a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column) pairs; the index names follow the SQLModel naming
+# convention so autogenerate sees them as matching the models.
+INDEXED_COLUMNS = [
+    ("conference", "created_by_user_id"),
+    ("conference", "start_date"),
+    ("tag", "user_id"),
+    ("conferencemilestone", "conference_id"),
+    ("conferencemilestone", "date"),
+    ("conferencesubscription", "conference_id"),
+    ("tagconferencelink", "conference_id"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; building
+    # the indexes concurrently keeps the tables writable on a live database.
+    # IF NOT EXISTS lets a partially applied upgrade be rerun (drop any index
+    # left INVALID by a failed concurrent build first).
+    with op.get_context().autocommit_block():
+        for table, column in INDEXED_COLUMNS:
+            op.create_index(
+                op.f(f"ix_{table}_{column}"),
+                table,
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, column in reversed(INDEXED_COLUMNS):
+            op.drop_index(
+                op.f(f"ix_{table}_{column}"),
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
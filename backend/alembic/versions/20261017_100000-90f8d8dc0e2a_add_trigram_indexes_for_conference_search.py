@@ -0,0 +1,51 @@
+"""Add trigram indexes for conference search
+
+Revision ID: 90f8d8dc0e2a
+Revises: 167e318d5be3
+Create Date: 2026-10-17 10:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "90f8d8dc0e2a"
+down_revision: str | None = "167e318d5be3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TRIGRAM_COLUMNS = ["name", "location"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm ships with PostgreSQL; creating it needs the CREATE privilege
+    # on the database.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for column in TRIGRAM_COLUMNS:
+            op.create_index(
+                f"ix_conference_{column}_trgm",
+                "conference",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in reversed(TRIGRAM_COLUMNS):
+            op.drop_index(
+                f"ix_conference_{column}_trgm",
+                table_name="conference",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    # The pg_trgm extension is left installed; other objects may depend on it.
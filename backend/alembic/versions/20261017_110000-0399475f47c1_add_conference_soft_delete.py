@@ -0,0 +1,47 @@
+"""Add conference soft delete
+
+Revision ID: 0399475f47c1
+Revises: 90f8d8dc0e2a
+Create Date: 2026-10-17 11:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0399475f47c1"
+down_revision: str | None = "90f8d8dc0e2a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("conference", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_conference_updated_at"),
+            "conference",
+            ["updated_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_conference_updated_at"),
+            table_name="conference",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    # Tombstones would resurface as live conferences once the column is gone.
+    op.execute("DELETE FROM conference WHERE deleted_at IS NOT NULL")
+    op.drop_column("conference", "deleted_at")
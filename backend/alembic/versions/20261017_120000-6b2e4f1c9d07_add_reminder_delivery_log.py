@@ -0,0 +1,41 @@
+"""Add reminder delivery log
+
+Revision ID: 6b2e4f1c9d07
+Revises: 0399475f47c1
+Create Date: 2026-10-17 12:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b2e4f1c9d07"
+down_revision: str | None = "0399475f47c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "reminderdelivery",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("milestone_id", sa.Uuid(), nullable=False),
+        sa.Column("offset_days", sa.Integer(), nullable=False),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["milestone_id"], ["conferencemilestone.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "milestone_id", "offset_days"),
+    )
+    # The table is new and empty, so there is nothing to build concurrently.
+    op.create_index(op.f("ix_reminderdelivery_milestone_id"), "reminderdelivery", ["milestone_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_reminderdelivery_milestone_id"), table_name="reminderdelivery")
+    op.drop_table("reminderdelivery")
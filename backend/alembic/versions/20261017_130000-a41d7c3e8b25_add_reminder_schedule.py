@@ -0,0 +1,51 @@
+"""Add reminder schedule
+
+Revision ID: a41d7c3e8b25
+Revises: 6b2e4f1c9d07
+Create Date: 2026-10-17 13:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a41d7c3e8b25"
+down_revision: str | None = "6b2e4f1c9d07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "reminderdue",
+        sa.Column("milestone_id", sa.Uuid(), nullable=False),
+        sa.Column("offset_days", sa.Integer(), nullable=False),
+        sa.Column("due_date", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["milestone_id"], ["conferencemilestone.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("milestone_id", "offset_days"),
+    )
+    # The table is new and empty, so there is nothing to build concurrently.
+    op.create_index(op.f("ix_reminderdue_due_date"), "reminderdue", ["due_date"], unique=False)
+    # Schedule the existing milestones for the default offsets; with other
+    # REMINDER_OFFSETS_DAYS, run scholark.cli.rebuild_reminder_schedule.
+    op.execute(
+        """
+        INSERT INTO reminderdue (milestone_id, offset_days, due_date)
+        SELECT conferencemilestone.id, offsets.days, conferencemilestone.date - offsets.days
+        FROM conferencemilestone
+        JOIN conference ON conference.id = conferencemilestone.conference_id
+        CROSS JOIN (VALUES (30), (7)) AS offsets (days)
+        WHERE conference.deleted_at IS NULL
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_reminderdue_due_date"), table_name="reminderdue")
+    op.drop_table("reminderdue")
@@ -0,0 +1,42 @@
+"""Add outbox
+
+Revision ID: d85f02b7e6a3
+Revises: a41d7c3e8b25
+Create Date: 2026-10-17 14:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d85f02b7e6a3"
+down_revision: str | None = "a41d7c3e8b25"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "outboxmessage",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("channel", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("text", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # The table is new and empty, so there is nothing to build concurrently.
+    op.create_index(op.f("ix_outboxmessage_next_attempt_at"), "outboxmessage", ["next_attempt_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_outboxmessage_next_attempt_at"), table_name="outboxmessage")
+    op.drop_table("outboxmessage")
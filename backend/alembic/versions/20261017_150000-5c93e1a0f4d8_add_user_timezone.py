@@ -0,0 +1,30 @@
+"""Add user timezone
+
+Revision ID: 5c93e1a0f4d8
+Revises: d85f02b7e6a3
+Create Date: 2026-10-17 15:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c93e1a0f4d8"
+down_revision: str | None = "d85f02b7e6a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("user", sa.Column("timezone", sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user", "timezone")
@@ -0,0 +1,124 @@
+"""Login throughput under concurrency, and what it does to other requests.
+
+Serves the app with uvicorn against a temporary SQLite database, fires
+--logins logins from --concurrency clients at once, and meanwhile times a
+health check every 50 ms: it runs on the same request thread pool, so its
+latency shows whether a burst of logins stalls unrelated endpoints. Prints
+the results as JSON. Compare the hashing pool's admission control with a
+queue deep enough to admit every login:
+
+    dotenvx run -f ../.env -- uv run python benchmarks/login.py --concurrency 64
+    dotenvx run -f ../.env -- uv run python benchmarks/login.py --concurrency 64 --queue-depth 1000
+"""
+
+import argparse
+import json
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import uvicorn
+from sqlmodel import Session, SQLModel, create_engine
+
+from scholark.api.deps import get_db
+from scholark.auth.db_provider import DbAuthProvider
+from scholark.core.config import settings
+from scholark.main import app
+from scholark.models import UserCreate
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Login throughput under concurrency.")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument("--queue-depth", type=int, default=settings.PASSWORD_HASH_QUEUE_DEPTH)
+    args = parser.parse_args()
+    # Read when the hashing pool is first used.
+    settings.PASSWORD_HASH_WORKERS = args.workers
+    settings.PASSWORD_HASH_QUEUE_DEPTH = args.queue_depth
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'login.db'}", connect_args={"check_same_thread": False})
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            DbAuthProvider().create_user(
+                session,
+                user_create=UserCreate(username="alice", password="alicepassword"),  # noqa: S106
+            )
+
+        def get_db_override() -> Generator[Session]:
+            with Session(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_db] = get_db_override
+        port = free_port()
+        server = uvicorn.Server(uvicorn.Config(app, port=port, lifespan="off", log_level="warning"))
+        threading.Thread(target=server.run, daemon=True).start()
+        while not server.started:
+            time.sleep(0.01)
+        base_url = f"http://127.0.0.1:{port}{settings.API_V1_STR}"
+
+        done = threading.Event()
+        health_latencies: list[float] = []
+
+        def probe_health() -> None:
+            with httpx.Client(base_url=base_url, timeout=60) as client:
+                while not done.is_set():
+                    start = time.perf_counter()
+                    client.get("/health/").raise_for_status()
+                    health_latencies.append(time.perf_counter() - start)
+                    done.wait(0.05)
+
+        local = threading.local()
+
+        def log_in(_: int) -> int:
+            if not hasattr(local, "client"):
+                local.client = httpx.Client(base_url=base_url, timeout=60)
+            response = local.client.post("/login/access-token", data={"username": "alice", "password": "alicepassword"})
+            return int(response.status_code)
+
+        probe = threading.Thread(target=probe_health)
+        probe.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            statuses = Counter(executor.map(log_in, range(args.logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        probe.join()
+        server.should_exit = True
+
+    quantiles = statistics.quantiles(health_latencies, n=100)
+    print(
+        json.dumps(
+            {
+                "hash_workers": args.workers,
+                "hash_queue_depth": args.queue_depth,
+                "concurrency": args.concurrency,
+                "logins_ok": statuses[200],
+                "logins_refused": statuses[503],
+                "logins_ok_per_second": round(statuses[200] / elapsed, 1),
+                "health_p50_ms": round(quantiles[49] * 1000, 1),
+                "health_p99_ms": round(quantiles[98] * 1000, 1),
+                "health_max_ms": round(max(health_latencies) * 1000, 1),
+            },
+            indent=2,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Dry-run the milestone reminder job against a synthetic dataset.
+
+Seeds an in-memory SQLite database with users subscribed to conferences
+whose milestones are due today, runs the job with dry_run=True and prints
+its metrics as JSON. To measure against PostgreSQL, run
+`python -m scholark.cli.send_reminders --dry-run` on a copy of the data.
+
+    dotenvx run -f ../.env -- uv run python benchmarks/reminders.py --users 5000
+"""
+
+import argparse
+import dataclasses
+import json
+import random
+import uuid
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, func, select
+from sqlmodel.pool import StaticPool
+
+from scholark.core.config import settings
+from scholark.models import Conference, ConferenceMilestone, ConferenceSubscription, ReminderDue, User
+from scholark.reminders import rebuild_schedule
+from scholark.slack import send_milestone_reminders
+
+
+def seed(session: Session, users: int, conferences: int, subscriptions_per_user: int) -> None:
+    now = datetime.now(UTC)
+    today = datetime.now(tz=ZoneInfo(settings.REMINDER_TIMEZONE)).date()
+    offsets = settings.REMINDER_OFFSETS_DAYS
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    conference_ids = [uuid.uuid4() for _ in range(conferences)]
+    session.execute(
+        insert(User),
+        [
+            {"id": user_id, "username": f"user{i}", "slack_user_id": f"U{i}", "created_at": now, "updated_at": now}
+            for i, user_id in enumerate(user_ids)
+        ],
+    )
+    session.execute(
+        insert(Conference),
+        [
+            {"id": conference_id, "name": f"Conference {i}", "created_at": now, "updated_at": now}
+            for i, conference_id in enumerate(conference_ids)
+        ],
+    )
+    # One milestone per conference due today for some offset, one not due.
+    session.execute(
+        insert(ConferenceMilestone),
+        [
+            {
+                "id": uuid.uuid4(),
+                "conference_id": conference_id,
+                "name": name,
+                "date": today + timedelta(days=days),
+            }
+            for i, conference_id in enumerate(conference_ids)
+            for name, days in [("Due", offsets[i % len(offsets)]), ("Not due", max(offsets) + 1)]
+        ],
+    )
+    session.execute(
+        insert(ConferenceSubscription),
+        [
+            {"user_id": user_id, "conference_id": conference_id, "created_at": now}
+            for user_id in user_ids
+            for conference_id in random.sample(conference_ids, min(subscriptions_per_user, conferences))
+        ],
+    )
+    rebuild_schedule(session)
+    session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dry-run the milestone reminder job against a synthetic dataset.")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--conferences", type=int, default=200)
+    parser.add_argument("--subscriptions-per-user", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, args.users, args.conferences, args.subscriptions_per_user)
+        print(f"Scheduled {session.exec(select(func.count()).select_from(ReminderDue)).one()} reminders")
+        metrics = send_milestone_reminders(session, dry_run=True)
+    print(json.dumps(dataclasses.asdict(metrics), indent=2))
+
+
+if __name__ == "__main__":
+    main()
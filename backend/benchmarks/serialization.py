@@ -0,0 +1,140 @@
+"""Per-row cost of building and encoding the conference list response.
+
+Compares the model path (a ConferencePublic per row, then FastAPI's
+validation and serialization against the response model) with the encoded
+path the list endpoint uses (each conference encoded once and cached, the
+per-user members appended and the JSON body assembled directly). No
+database is needed; conferences are built in memory.
+
+    dotenvx run -f ../.env -- uv run python benchmarks/serialization.py
+"""
+
+import argparse
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+from datetime import time as time_
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from scholark.api.routes.conferences import _shared_public
+from scholark.api.serialization import extend_object, json_array, json_object, member
+from scholark.core.cache import conference_cache
+from scholark.models import Conference, ConferenceMilestone, ConferencePublic, ConferencesPublic, Tag, TagPublic
+
+
+def build_dataset(size: int) -> tuple[list[Conference], dict[uuid.UUID, list[Tag]]]:
+    now = datetime.now(UTC)
+    user_id = uuid.uuid4()
+    tags = [Tag(id=uuid.uuid4(), name=f"Tag {i}", color="#123abc", user_id=user_id) for i in range(3)]
+    conferences = []
+    tags_by_conference = {}
+    for i in range(size):
+        conference = Conference(
+            id=uuid.uuid4(),
+            name=f"Conference {i}",
+            start_date=date(2027, 6, 1),
+            end_date=date(2027, 6, 5),
+            location="Tokyo, Japan",
+            website_url="https://example.com",
+            created_at=now,
+            updated_at=now,
+            created_by_user_id=user_id,
+        )
+        conference.milestones = [
+            ConferenceMilestone(id=uuid.uuid4(), conference_id=conference.id, name="Abstract", date=date(2027, 1, 15)),
+            ConferenceMilestone(
+                id=uuid.uuid4(),
+                conference_id=conference.id,
+                name="Paper",
+                date=date(2027, 3, 1),
+                time=time_(23, 59, tzinfo=UTC),
+            ),
+        ]
+        conferences.append(conference)
+        tags_by_conference[conference.id] = tags[: i % 4]
+    return conferences, tags_by_conference
+
+
+def model_path(conferences: list[Conference], tags_by_conference: dict[uuid.UUID, list[Tag]]) -> bytes:
+    body = ConferencesPublic(
+        data=[
+            ConferencePublic.model_validate(
+                conference,
+                update={
+                    "tags": [TagPublic.model_validate(tag) for tag in tags_by_conference[conference.id]],
+                    "is_subscribed": True,
+                },
+            )
+            for conference in conferences
+        ],
+        count=len(conferences),
+    )
+    # What FastAPI does with the returned value for response_model.
+    adapter = TypeAdapter(ConferencesPublic)
+    return adapter.dump_json(adapter.validate_python(body))
+
+
+def encoded_path(conferences: list[Conference], tags_by_conference: dict[uuid.UUID, list[Tag]]) -> bytes:
+    # Mirrors read_conferences: cached members, per-user tags and flag, one encode.
+    items = []
+    encoded_tags: dict[uuid.UUID, bytes] = {}
+    for conference in conferences:
+        entry = conference_cache.get(conference.id)
+        shared = entry[1] if entry is not None else _shared_public(conference)
+        tags = []
+        for tag in tags_by_conference[conference.id]:
+            if tag.id not in encoded_tags:
+                encoded_tags[tag.id] = to_json(
+                    {"name": tag.name, "color": tag.color, "id": tag.id, "user_id": tag.user_id},
+                )
+            tags.append(encoded_tags[tag.id])
+        items.append(extend_object(shared, [member("tags", json_array(tags)), member("is_subscribed", b"true")]))
+    return json_object(
+        [member("data", json_array(items)), member("count", to_json(len(conferences))), member("next_cursor", b"null")],
+    )
+
+
+def measure(label: str, size: int, repeat: int, run: Callable[[], object], setup: Callable[[], object]) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best / size * 1e6:8.1f} us/row  {best * 1e3:8.1f} ms total")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-row cost of building and encoding the conference list response.")
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    conferences, tags_by_conference = build_dataset(args.size)
+    conference_cache.maxsize = args.size
+
+    def warm() -> None:
+        encoded_path(conferences, tags_by_conference)
+
+    measure("model path", args.size, args.repeat, lambda: model_path(conferences, tags_by_conference), lambda: None)
+    measure(
+        "encoded path, cold cache",
+        args.size,
+        args.repeat,
+        lambda: encoded_path(conferences, tags_by_conference),
+        conference_cache.clear,
+    )
+    measure(
+        "encoded path, warm cache",
+        args.size,
+        args.repeat,
+        lambda: encoded_path(conferences, tags_by_conference),
+        warm,
+    )
+
+
+if __name__ == "__main__":
+    main()
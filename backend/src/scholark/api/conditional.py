@@ -0,0 +1,45 @@
+"""Conditional GET support: ETag validators and 304 checks.
+
+Responses are per user and depend on state without a modification time,
+such as removed subscriptions and tag assignments, so they carry no
+Last-Modified: a date could not change with that state, or could even move
+backwards, and If-Modified-Since would then get a stale 304.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+
+from fastapi import Request
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong entity tag from the values the representation depends on."""
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def as_utc(value: datetime) -> datetime:
+    """Return the datetime in UTC, treating naive values (as SQLite returns them) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def validator_headers(etag: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        # Responses are per user, and must be revalidated before reuse.
+        "Cache-Control": "private, no-cache",
+    }
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Evaluate If-None-Match for a GET request.
+
+    If-Modified-Since is ignored, as no Last-Modified is ever sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
@@ -1,3 +1,4 @@
+import time
 import uuid
 from collections.abc import Generator
 from typing import Annotated
@@ -10,10 +11,9 @@ from pydantic import ValidationError
 from sqlmodel import Session
 
 from scholark.auth.base import AuthProvider
-from scholark.auth.db_provider import DbAuthProvider
-from scholark.auth.ldap_provider import LdapAuthProvider
-from scholark.auth.router import AuthRouter
+from scholark.auth.registry import auth_provider
 from scholark.core import security
+from scholark.core.cache import AuthenticatedUser, user_cache
 from scholark.core.config import settings
 from scholark.core.db import engine
 from scholark.models import TokenPayload, User
@@ -34,7 +34,12 @@ SkipParam = Annotated[int, Query(ge=0)]
 LimitParam = Annotated[int, Query(ge=1, le=100)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
+def get_current_user(session: SessionDep, token: TokenDep) -> AuthenticatedUser:
+    """Authenticate the bearer token, from user_cache when it has the user.
+
+    Most endpoints only need the user's id and privileges, so a cache hit
+    spares them a query; those that need the whole row use CurrentUserRecord.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -49,12 +54,26 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
     except (InvalidTokenError, ValidationError, ValueError):
         raise credentials_exception from None
 
-    user = session.get(User, user_id)
-    if user is None:
-        # The token was valid but its user no longer exists; treat the bearer
-        # as unauthenticated rather than answering 404 on every endpoint.
-        raise credentials_exception
-    if user.disabled:
+    now = time.monotonic()
+    entry = user_cache.get(user_id)
+    if entry is not None and entry[0] > now:
+        current_user = entry[1]
+    else:
+        # Loaded as an entity, so a CurrentUserRecord of the same request
+        # finds it in the session's identity map.
+        user = session.get(User, user_id)
+        if user is None:
+            # The token was valid but its user no longer exists; treat the bearer
+            # as unauthenticated rather than answering 404 on every endpoint.
+            raise credentials_exception
+        current_user = AuthenticatedUser(
+            id=user.id,
+            disabled=user.disabled,
+            is_superuser=user.is_superuser,
+            role=user.role,
+        )
+        user_cache.set(user_id, (now + settings.USER_CACHE_TTL.total_seconds(), current_user))
+    if current_user.disabled:
         # 401 so clients treat the token as no longer valid and re-authenticate.
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,13 +81,28 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return current_user
+
+
+CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_user)]
+
+
+def get_current_user_record(session: SessionDep, current_user: CurrentUser) -> User:
+    user = session.get(User, current_user.id)
+    if user is None:
+        # Deleted since it was cached.
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUserRecord = Annotated[User, Depends(get_current_user_record)]
 
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
+def get_current_active_superuser(current_user: CurrentUser) -> AuthenticatedUser:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -77,28 +111,4 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
     return current_user
 
 
-def get_auth_provider(session: SessionDep) -> AuthProvider:
-    match settings.AUTH_PROVIDER:
-        case "db":
-            return DbAuthProvider(session)
-        case "ldap":
-            # Not asserts: those vanish under python -O and this is a
-            # deployment configuration error worth a clear message.
-            if not settings.LDAP_SERVER or not settings.LDAP_DN_PATTERN:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="LDAP auth is enabled but SCHOLARK_LDAP_SERVER or SCHOLARK_LDAP_DN_PATTERN is not set",
-                )
-            return AuthRouter(
-                db_provider=DbAuthProvider(session),
-                ldap_provider=LdapAuthProvider(session, settings.LDAP_SERVER, settings.LDAP_DN_PATTERN),
-                preserved_db_usernames=settings.PRESERVED_DB_USERNAMES,
-            )
-        case _:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Unknown auth provider: {settings.AUTH_PROVIDER}",
-            )
-
-
-AuthProviderDep = Annotated[AuthProvider, Depends(get_auth_provider)]
+AuthProviderDep = Annotated[AuthProvider, Depends(auth_provider)]
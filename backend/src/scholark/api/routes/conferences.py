@@ -1,13 +1,37 @@
+import base64
+import json
 import logging
-from datetime import UTC, datetime
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from sqlmodel import col, func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic_core import to_json
+from sqlalchemy import ColumnElement, Exists, and_, exists, or_
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, func, select
+from sqlmodel.sql.expression import Select
 
+from scholark import outbox, reminders
+from scholark.api.conditional import as_utc, is_not_modified, make_etag, validator_headers
 from scholark.api.deps import CurrentUser, LimitParam, SessionDep, SkipParam, get_current_active_superuser
+from scholark.api.serialization import (
+    extend_object,
+    json_array,
+    json_object,
+    json_response,
+    member,
+    public_columns,
+    row_dicts,
+)
+from scholark.core import invalidation
+from scholark.core.cache import conference_cache
+from scholark.core.config import settings
 from scholark.models import (
     Conference,
+    ConferenceChanges,
     ConferenceCreate,
     ConferenceMilestone,
     ConferencePublic,
@@ -16,48 +40,364 @@ from scholark.models import (
     ConferenceUpdate,
     Message,
     Tag,
+    TagConferenceLink,
     TagPublic,
 )
-from scholark.slack import build_new_conference_message, send_channel_message
+from scholark.slack import build_new_conference_message
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/conferences", tags=["conferences"])
 
 
-def _conference_to_public(conference: Conference, user_id: UUID) -> ConferencePublic:
-    """Convert a Conference to ConferencePublic for the given user.
+def _subscription_exists(user_id: UUID) -> Exists:
+    """Match conference rows the user is subscribed to.
 
-    Only the user's own tags are included, and is_subscribed is computed for
-    the user. Filtering happens while building the response model; the ORM
-    relationship must not be mutated for presentation, since SQLAlchemy would
-    flush the removal as DELETEs on the tag-conference link table.
+    An EXISTS against the subscription primary key, so the answer costs one
+    index probe per row instead of loading every subscriber.
     """
-    return ConferencePublic.model_validate(
-        conference,
-        update={
-            "tags": [TagPublic.model_validate(tag) for tag in conference.tags if tag.user_id == user_id],
-            "is_subscribed": any(s.id == user_id for s in conference.subscribers),
-        },
+    return exists().where(
+        col(ConferenceSubscription.conference_id) == Conference.id,
+        col(ConferenceSubscription.user_id) == user_id,
     )
 
 
-@router.get("/")
-def read_conferences(
-    session: SessionDep,
+def _contains(column: Any, text: str) -> ColumnElement[bool]:
+    """Match a case-insensitive substring, with LIKE wildcards in the text escaped."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return col(column).ilike(f"%{escaped}%", escape="\\")
+
+
+def _tag_filter(tag_ids: list[UUID], tag_match: Literal["any", "all"], user_id: UUID) -> ColumnElement[bool]:
+    """Match conferences carrying any or all of the given tags of the user.
+
+    Only the user's own tags count, so other users' tag ids match nothing.
+    """
+    conditions = (
+        col(TagConferenceLink.conference_id) == Conference.id,
+        col(TagConferenceLink.tag_id).in_(tag_ids),
+        Tag.user_id == user_id,
+    )
+    if tag_match == "any":
+        return select(TagConferenceLink.tag_id).join(Tag).where(*conditions).exists()
+    # The (tag_id, conference_id) primary key makes each matching link count once.
+    matched = select(func.count()).select_from(TagConferenceLink).join(Tag).where(*conditions).scalar_subquery()
+    return matched == len(set(tag_ids))
+
+
+def _conference_filters(  # noqa: PLR0913
     current_user: CurrentUser,
-    skip: SkipParam = 0,
-    limit: LimitParam = 100,
-) -> ConferencesPublic:
-    """Retrieve a list of conferences."""
-    count_statement = select(func.count()).select_from(Conference)
-    count = session.exec(count_statement).one()
-    statement = select(Conference).order_by(col(Conference.start_date)).offset(skip).limit(limit)
+    *,
+    q: Annotated[str | None, Query(description="Case-insensitive substring of the conference name")] = None,
+    start_from: date | None = None,
+    start_to: date | None = None,
+    end_from: date | None = None,
+    end_to: date | None = None,
+    location: Annotated[str | None, Query(description="Case-insensitive substring of the location")] = None,
+    milestone_before: Annotated[
+        date | None,
+        Query(description="Only conferences with a milestone strictly before this date"),
+    ] = None,
+    tag_ids: Annotated[list[UUID] | None, Query(description="Only conferences tagged with the user's tags")] = None,
+    tag_match: Annotated[
+        Literal["any", "all"],
+        Query(description="Whether conferences need any or all of tag_ids"),
+    ] = "any",
+    subscribed: Annotated[bool, Query(description="Only conferences the user is subscribed to")] = False,
+) -> list[ColumnElement[bool]]:
+    """Build the SQL conditions for the conference list query parameters."""
+    filters: list[ColumnElement[bool]] = []
+    if q:
+        filters.append(_contains(Conference.name, q))
+    if location:
+        filters.append(_contains(Conference.location, location))
+    if start_from is not None:
+        filters.append(col(Conference.start_date) >= start_from)
+    if start_to is not None:
+        filters.append(col(Conference.start_date) <= start_to)
+    if end_from is not None:
+        filters.append(col(Conference.end_date) >= end_from)
+    if end_to is not None:
+        filters.append(col(Conference.end_date) <= end_to)
+    if milestone_before is not None:
+        filters.append(
+            exists().where(
+                col(ConferenceMilestone.conference_id) == Conference.id,
+                col(ConferenceMilestone.date) < milestone_before,
+            ),
+        )
+    if subscribed:
+        filters.append(_subscription_exists(current_user.id))
+    if tag_ids:
+        filters.append(_tag_filter(tag_ids, tag_match, current_user.id))
+    return filters
+
+
+ConferenceFiltersDep = Annotated[list[ColumnElement[bool]], Depends(_conference_filters)]
+
+
+def _conference_rows_statement(user_id: UUID) -> Select[UUID, datetime, bool]:
+    """Select (id, updated_at, is_subscribed) rows of current conferences.
+
+    Plain columns rather than ORM entities: the shared part of each
+    conference comes from conference_cache when its updated_at still
+    matches, and only misses are loaded through the ORM.
+    """
+    return select(
+        Conference.id,
+        Conference.updated_at,
+        _subscription_exists(user_id).label("is_subscribed"),
+    ).where(col(Conference.deleted_at).is_(None))
+
+
+# Members of ConferencePublic that differ between users, added by _overlay_user().
+_PER_USER_FIELDS = {"tags", "is_subscribed"}
+
+
+def _shared_public(conference: Conference) -> bytes:
+    """Encode the user-independent part of a ConferencePublic as one JSON object, and cache it."""
+    # Passing tags avoids lazy-loading every user's tags through the relationship.
+    public = ConferencePublic.model_validate(conference, update={"tags": []})
+    shared = ConferencePublic.__pydantic_serializer__.to_json(public, exclude=_PER_USER_FIELDS)
+    conference_cache.set(conference.id, (as_utc(conference.updated_at), shared))
+    return shared
+
+
+def _shared_conferences(session: Session, versions: dict[UUID, datetime]) -> dict[UUID, bytes]:
+    """Return the user-independent part of the given conferences.
+
+    Current cache entries are used as is; the rest are loaded with their
+    milestones in two batched queries and cached.
+    """
+    shared: dict[UUID, bytes] = {}
+    for conference_id, updated_at in versions.items():
+        entry = conference_cache.get(conference_id)
+        if entry is not None and entry[0] == as_utc(updated_at):
+            shared[conference_id] = entry[1]
+
+    missing = [conference_id for conference_id in versions if conference_id not in shared]
+    if missing:
+        statement = (
+            select(Conference).where(col(Conference.id).in_(missing)).options(selectinload(Conference.milestones))  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
+        )
+        for conference in session.exec(statement):
+            shared[conference.id] = _shared_public(conference)
+    return shared
+
+
+def _overlay_user(
+    session: Session,
+    shared: Sequence[tuple[UUID, bytes, bool]],
+    user_id: UUID,
+) -> list[bytes]:
+    """Add the user's own tags and is_subscribed flag to shared conferences.
+
+    Only the user's own tags are included, fetched with a single query over
+    the user's tags instead of loading every user's tags through the ORM
+    relationship. The relationship must not be filtered in place for
+    presentation either, since SQLAlchemy would flush the removal as DELETEs
+    on the tag-conference link table.
+    """
+    tags_by_conference: defaultdict[UUID, list[bytes]] = defaultdict(list)
+    if shared:
+        tag_statement = (
+            select(TagConferenceLink.conference_id, *public_columns(Tag, TagPublic))
+            .join(Tag, col(Tag.id) == TagConferenceLink.tag_id)
+            .where(
+                Tag.user_id == user_id,
+                col(TagConferenceLink.conference_id).in_([conference_id for conference_id, _, _ in shared]),
+            )
+            .order_by(col(Tag.name))
+        )
+        encoded_tags: dict[UUID, bytes] = {}
+        for tag in row_dicts(session.execute(tag_statement)):
+            conference_id = tag.pop("conference_id")
+            if tag["id"] not in encoded_tags:
+                encoded_tags[tag["id"]] = to_json(tag)
+            tags_by_conference[conference_id].append(encoded_tags[tag["id"]])
+
+    subscribed = {value: member("is_subscribed", to_json(value)) for value in (False, True)}
+    return [
+        extend_object(
+            encoded,
+            [member("tags", json_array(tags_by_conference[conference_id])), subscribed[is_subscribed]],
+        )
+        for conference_id, encoded, is_subscribed in shared
+    ]
+
+
+def _conference_items(
+    session: Session,
+    rows: Sequence[tuple[UUID, datetime, bool]],
+    user_id: UUID,
+) -> list[bytes]:
+    """Encode (id, updated_at, is_subscribed) rows as ConferencePublic objects for the given user."""
+    shared = _shared_conferences(session, {conference_id: updated_at for conference_id, updated_at, _ in rows})
+    return _overlay_user(
+        session,
+        [(conference_id, shared[conference_id], is_subscribed) for conference_id, _, is_subscribed in rows],
+        user_id,
+    )
+
+
+def _conference_to_public(session: Session, conference: Conference, user_id: UUID) -> ConferencePublic:
+    """Convert an already loaded Conference to ConferencePublic for the given user."""
+    is_subscribed = session.get(ConferenceSubscription, (user_id, conference.id)) is not None
+    [item] = _overlay_user(session, [(conference.id, _shared_public(conference), is_subscribed)], user_id)
+    return ConferencePublic.model_validate_json(item)
+
+
+def _get_conference(session: Session, conference_id: UUID) -> Conference:
+    """Load a conference for a write, answering 404 for missing or deleted ones."""
+    conference = session.get(Conference, conference_id)
+    if not conference or conference.deleted_at is not None:
+        raise HTTPException(status_code=404, detail="Conference not found")
+    return conference
+
+
+def _encode_token(*values: str | None) -> str:
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_token(token: str, detail: str) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=detail) from None
+    if not isinstance(values, list):
+        raise HTTPException(status_code=400, detail=detail)
+    return values
+
+
+def _encode_cursor(conference: bytes) -> str:
+    """Encode the keyset position after the given (encoded) conference as an opaque cursor."""
+    position = json.loads(conference)
+    return _encode_token(position["start_date"], position["id"])
 
-    conferences = session.exec(statement).all()
 
-    conferences_public = [_conference_to_public(conference, current_user.id) for conference in conferences]
+def _decode_cursor(cursor: str) -> tuple[date | None, UUID]:
+    try:
+        start_date, conference_id = _decode_token(cursor, "Invalid cursor")
+        return (date.fromisoformat(start_date) if start_date is not None else None), UUID(conference_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
 
-    return ConferencesPublic(data=conferences_public, count=count)
+
+def _after_cursor(start_date: date | None, conference_id: UUID) -> ColumnElement[bool]:
+    """Match conferences after the cursor position in the list order.
+
+    The list is ordered by (start_date, id) with undated conferences last,
+    so the comparison spells out the NULL handling instead of relying on a
+    row-value comparison.
+    """
+    if start_date is None:
+        return and_(col(Conference.start_date).is_(None), col(Conference.id) > conference_id)
+    return or_(
+        col(Conference.start_date) > start_date,
+        and_(col(Conference.start_date) == start_date, col(Conference.id) > conference_id),
+        col(Conference.start_date).is_(None),
+    )
+
+
+def _tag_assignments(session: Session, user_id: UUID, conference_id: UUID | None = None) -> list[tuple[Any, ...]]:
+    """Return the user's tag assignments, for entity tags of per-user responses."""
+    statement = (
+        select(TagConferenceLink.conference_id, Tag.id, Tag.name, Tag.color)
+        .join(Tag, col(Tag.id) == TagConferenceLink.tag_id)
+        .where(Tag.user_id == user_id)
+        .order_by(col(TagConferenceLink.conference_id), col(Tag.id))
+    )
+    if conference_id is not None:
+        statement = statement.where(TagConferenceLink.conference_id == conference_id)
+    return [tuple(row) for row in session.exec(statement)]
+
+
+def _list_etag(session: Session, user_id: UUID) -> str:
+    """Compute the ETag of the conference list for the user.
+
+    One aggregate query over the catalogue and the user's subscriptions plus
+    the user's tag assignments, so an unchanged list is answered without
+    building the page. Deletions bump the tombstone's updated_at, so they
+    change the ETag too. The ETag covers the whole catalogue regardless
+    of filters and pagination: any change invalidates every list URL.
+    """
+    own_subscriptions = col(ConferenceSubscription.user_id) == user_id
+    last_updated, conference_count, last_subscribed, subscription_count = session.exec(
+        select(
+            select(func.max(Conference.updated_at)).scalar_subquery(),
+            select(func.count()).select_from(Conference).where(col(Conference.deleted_at).is_(None)).scalar_subquery(),
+            select(func.max(ConferenceSubscription.created_at)).where(own_subscriptions).scalar_subquery(),
+            select(func.count()).select_from(ConferenceSubscription).where(own_subscriptions).scalar_subquery(),
+        ),
+    ).one()
+    return make_etag(
+        last_updated and as_utc(last_updated),
+        conference_count,
+        last_subscribed and as_utc(last_subscribed),
+        subscription_count,
+        _tag_assignments(session, user_id),
+    )
+
+
+@router.get("/", response_model=ConferencesPublic)
+def read_conferences(  # noqa: PLR0913
+    request: Request,
+    session: SessionDep,
+    current_user: CurrentUser,
+    filters: ConferenceFiltersDep,
+    *,
+    skip: SkipParam = 0,
+    limit: LimitParam = 100,
+    cursor: str | None = None,
+    with_count: bool = True,
+) -> Any:
+    """Retrieve a list of conferences.
+
+    Conferences are ordered by start date (undated last), then by id, and
+    narrowed by the filter query parameters, all applied in SQL. Pass
+    the returned next_cursor as cursor to fetch the following page with a
+    keyset seek instead of an offset scan; skip is then not allowed. Set
+    with_count=false to skip counting the whole catalogue.
+
+    Responses carry an ETag; a matching If-None-Match is answered with
+    304 Not Modified.
+    """
+    etag = _list_etag(session, current_user.id)
+    headers = validator_headers(etag)
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    statement = (
+        _conference_rows_statement(current_user.id)
+        .where(*filters)
+        .order_by(
+            col(Conference.start_date).asc().nulls_last(),
+            col(Conference.id),
+        )
+    )
+    if cursor is not None:
+        if skip:
+            raise HTTPException(status_code=400, detail="skip cannot be combined with cursor")
+        statement = statement.where(_after_cursor(*_decode_cursor(cursor)))
+    else:
+        statement = statement.offset(skip)
+
+    # One extra row tells whether there is a next page without counting.
+    rows = session.exec(statement.limit(limit + 1)).all()
+    conferences = _conference_items(session, rows[:limit], current_user.id)
+    next_cursor = _encode_cursor(conferences[-1]) if len(rows) > limit else None
+
+    count_statement = select(func.count()).select_from(Conference).where(col(Conference.deleted_at).is_(None), *filters)
+    count = session.exec(count_statement).one() if with_count else None
+
+    body = json_object(
+        [
+            member("data", json_array(conferences)),
+            member("count", to_json(count)),
+            member("next_cursor", to_json(next_cursor)),
+        ],
+    )
+    return json_response(body, headers=headers)
 
 
 @router.post("/")
@@ -66,7 +406,6 @@ def create_conference(
     current_user: CurrentUser,
     session: SessionDep,
     conference_in: ConferenceCreate,
-    background_tasks: BackgroundTasks,
 ) -> ConferencePublic:
     """Create a new conference."""
     milestones = conference_in.milestones or []
@@ -81,36 +420,143 @@ def create_conference(
 
     session.add(conference)
     session.flush()
+    reminders.schedule(session, conference.milestones)
 
     # Auto-subscribe the creating user
     subscription = ConferenceSubscription(user_id=current_user.id, conference_id=conference.id)
     session.add(subscription)
 
+    # Queued in the same transaction, so the announcement is sent (by the
+    # outbox worker, never by this request) if and only if the conference exists.
+    notification = build_new_conference_message(conference)
+    if notification is not None:
+        outbox.enqueue(session, notification)
+
     session.commit()
     session.refresh(conference)
+    return _conference_to_public(session, conference, current_user.id)
 
-    # Build the message now (while the session is alive) but post it after
-    # the response: the Slack HTTP call must not delay conference creation.
-    notification = build_new_conference_message(conference)
-    if notification is not None:
-        background_tasks.add_task(send_channel_message, notification)
 
-    return _conference_to_public(conference, current_user.id)
+def _decode_change_token(token: str) -> tuple[datetime, UUID | None]:
+    try:
+        updated_at, conference_id = _decode_token(token, "Invalid sync token")
+        return as_utc(datetime.fromisoformat(updated_at)), (UUID(conference_id) if conference_id is not None else None)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid sync token") from None
+
+
+def _after_change(updated_at: datetime, conference_id: UUID | None) -> ColumnElement[bool]:
+    """Match rows after the sync token position in (updated_at, id) order."""
+    if conference_id is None:
+        return col(Conference.updated_at) > updated_at
+    return or_(
+        col(Conference.updated_at) > updated_at,
+        and_(col(Conference.updated_at) == updated_at, col(Conference.id) > conference_id),
+    )
+
 
+@router.get("/changes", response_model=ConferenceChanges)
+def read_conference_changes(
+    session: SessionDep,
+    current_user: CurrentUser,
+    since: str | None = None,
+    limit: LimitParam = 100,
+) -> Any:
+    """Retrieve conferences created, updated or deleted since a sync token.
+
+    Without since, every current conference is returned (the initial sync).
+    Pass the returned next_token as since on the next call, right away while
+    has_more is true. Changes are reported once they are older than
+    CHANGES_SAFETY_MARGIN, so a write that commits after a poll is still
+    seen by the next one. That holds as long as every write transaction
+    commits, and the backend hosts' clocks agree, within the margin; a
+    change outside it can be skipped. The caller's tag assignments and
+    subscriptions are not tracked by the feed.
+    """
+    watermark = datetime.now(UTC) - settings.CHANGES_SAFETY_MARGIN
+    statement = (
+        select(Conference.id, Conference.updated_at, Conference.deleted_at)
+        .where(col(Conference.updated_at) <= watermark)
+        .order_by(col(Conference.updated_at), col(Conference.id))
+    )
+    if since is None:
+        statement = statement.where(col(Conference.deleted_at).is_(None))
+    else:
+        statement = statement.where(_after_change(*_decode_change_token(since)))
+
+    changes = session.exec(statement.limit(limit + 1)).all()
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if has_more:
+        last_id, last_updated_at, _ = changes[-1]
+        next_token = _encode_token(as_utc(last_updated_at).isoformat(), str(last_id))
+    else:
+        next_token = _encode_token(watermark.isoformat(), None)
+
+    upserted_ids = [conference_id for conference_id, _, deleted_at in changes if deleted_at is None]
+    rows = session.exec(
+        _conference_rows_statement(current_user.id)
+        .where(col(Conference.id).in_(upserted_ids))
+        .order_by(col(Conference.updated_at), col(Conference.id)),
+    ).all()
+    conferences = _conference_items(session, rows, current_user.id)
+    deleted = [conference_id for conference_id, _, deleted_at in changes if deleted_at is not None]
+    body = json_object(
+        [
+            member("data", json_array(conferences)),
+            member("deleted", to_json(deleted)),
+            member("next_token", to_json(next_token)),
+            member("has_more", to_json(has_more)),
+        ],
+    )
+    return json_response(body)
 
-@router.get("/{conference_id}")
+
+@router.get("/{conference_id}", response_model=ConferencePublic)
 def read_conference(
     *,
+    request: Request,
     current_user: CurrentUser,
     session: SessionDep,
     conference_id: UUID,
-) -> ConferencePublic:
-    """Retrieve a conference by ID."""
-    conference = session.get(Conference, conference_id)
-    if not conference:
+) -> Any:
+    """Retrieve a conference by ID.
+
+    Supports conditional requests like the list endpoint.
+    """
+    subscribed_at = (
+        select(ConferenceSubscription.created_at)
+        .where(
+            col(ConferenceSubscription.conference_id) == Conference.id,
+            col(ConferenceSubscription.user_id) == current_user.id,
+        )
+        .scalar_subquery()
+    )
+    state = session.exec(
+        select(Conference.updated_at, subscribed_at).where(
+            Conference.id == conference_id,
+            col(Conference.deleted_at).is_(None),
+        ),
+    ).first()
+    if not state:
+        raise HTTPException(status_code=404, detail="Conference not found")
+    updated_at, subscription_created_at = state
+    etag = make_etag(
+        as_utc(updated_at),
+        subscription_created_at and as_utc(subscription_created_at),
+        _tag_assignments(session, current_user.id, conference_id),
+    )
+    headers = validator_headers(etag)
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    statement = _conference_rows_statement(current_user.id).where(Conference.id == conference_id)
+    row = session.exec(statement).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Conference not found")
 
-    return _conference_to_public(conference, current_user.id)
+    [conference] = _conference_items(session, [row], current_user.id)
+    return json_response(conference, headers=headers)
 
 
 @router.delete(
@@ -123,14 +569,17 @@ def delete_conference(
     session: SessionDep,
     conference_id: UUID,
 ) -> ConferencePublic:
-    """Delete a conference by ID."""
-    # TODO: Implement soft delete
-    conference = session.get(Conference, conference_id)
-    if not conference:
-        raise HTTPException(status_code=404, detail="Conference not found")
-    # Serialize before deleting; the ORM instance is unusable after the flush.
-    conference_public = _conference_to_public(conference, current_user.id)
-    session.delete(conference)
+    """Delete a conference by ID.
+
+    The row is kept as a tombstone so that the changes feed can report the
+    deletion to clients.
+    """
+    conference = _get_conference(session, conference_id)
+    conference_public = _conference_to_public(session, conference, current_user.id)
+    conference.deleted_at = conference.updated_at = datetime.now(UTC)
+    session.add(conference)
+    reminders.unschedule(session, conference_id)
+    invalidation.publish(session, "conference", conference_id)
     session.commit()
     return conference_public
 
@@ -144,9 +593,7 @@ def update_conference(
     conference_in: ConferenceUpdate,
 ) -> ConferencePublic:
     """Update a conference by ID."""
-    conference = session.get(Conference, conference_id)
-    if not conference:
-        raise HTTPException(status_code=404, detail="Conference not found")
+    conference = _get_conference(session, conference_id)
 
     update_dict = conference_in.model_dump(exclude_unset=True)
     # milestones is a relationship, not a column; it is applied separately
@@ -193,10 +640,13 @@ def update_conference(
 
     if fields_changed or milestones_changed:
         conference.updated_at = datetime.now(UTC)
+        invalidation.publish(session, "conference", conference.id)
+    if milestones_changed:
+        reminders.reschedule(session, conference)
     session.add(conference)
     session.commit()
     session.refresh(conference)
-    return _conference_to_public(conference, current_user.id)
+    return _conference_to_public(session, conference, current_user.id)
 
 
 @router.post("/{conference_id}/tags")
@@ -208,9 +658,7 @@ def add_tag_to_conference(
     tag_id: UUID,
 ) -> ConferencePublic:
     """Add a tag to a conference."""
-    conference = session.get(Conference, conference_id)
-    if not conference:
-        raise HTTPException(status_code=404, detail="Conference not found")
+    conference = _get_conference(session, conference_id)
     tag_statement = select(Tag).where(Tag.id == tag_id, Tag.user_id == current_user.id)
     tag = session.exec(tag_statement).first()
     if not tag:
@@ -219,7 +667,7 @@ def add_tag_to_conference(
     session.add(conference)
     session.commit()
     session.refresh(conference)
-    return _conference_to_public(conference, current_user.id)
+    return _conference_to_public(session, conference, current_user.id)
 
 
 @router.delete("/{conference_id}/tags/{tag_id}")
@@ -231,9 +679,7 @@ def remove_tag_from_conference(
     tag_id: UUID,
 ) -> ConferencePublic:
     """Remove a tag from a conference."""
-    conference = session.get(Conference, conference_id)
-    if not conference:
-        raise HTTPException(status_code=404, detail="Conference not found")
+    conference = _get_conference(session, conference_id)
     tag_statement = select(Tag).where(Tag.id == tag_id, Tag.user_id == current_user.id)
     tag = session.exec(tag_statement).first()
     if not tag:
@@ -242,7 +688,7 @@ def remove_tag_from_conference(
     session.add(conference)
     session.commit()
     session.refresh(conference)
-    return _conference_to_public(conference, current_user.id)
+    return _conference_to_public(session, conference, current_user.id)
 
 
 @router.put("/{conference_id}/tags")
@@ -255,9 +701,7 @@ def update_tags_for_conference(
 ) -> ConferencePublic:
     """Update tags for a conference."""
     logger.info(f"Updating tags for conference {conference_id} with tags {tags}")
-    conference = session.get(Conference, conference_id)
-    if not conference:
-        raise HTTPException(status_code=404, detail="Conference not found")
+    conference = _get_conference(session, conference_id)
 
     existing_tag_ids = {tag.id for tag in conference.tags if tag.user_id == current_user.id}
 
@@ -283,7 +727,7 @@ def update_tags_for_conference(
     session.add(conference)
     session.commit()
     session.refresh(conference)
-    return _conference_to_public(conference, current_user.id)
+    return _conference_to_public(session, conference, current_user.id)
 
 
 @router.post("/{conference_id}/subscribe")
@@ -294,9 +738,7 @@ def subscribe_to_conference(
     conference_id: UUID,
 ) -> Message:
     """Subscribe the current user to a conference."""
-    conference = session.get(Conference, conference_id)
-    if not conference:
-        raise HTTPException(status_code=404, detail="Conference not found")
+    _get_conference(session, conference_id)
 
     existing = session.get(ConferenceSubscription, (current_user.id, conference_id))
     if existing:
@@ -3,7 +3,7 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 
-from scholark.api.deps import AuthProviderDep, CurrentUser
+from scholark.api.deps import AuthProviderDep, CurrentUserRecord, SessionDep
 from scholark.core import security
 from scholark.models import Token, UserPublic
 
@@ -12,11 +12,13 @@ router = APIRouter(prefix="/login", tags=["login"])
 
 @router.post("/access-token")
 def login_access_token(
+    session: SessionDep,
     auth_provider: AuthProviderDep,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> Token:
     """OAuth2 compatible token login, get an access token for future requests."""
     user = auth_provider.authenticate(
+        session,
         username=form_data.username,
         password=form_data.password,
     )
@@ -28,6 +30,6 @@ def login_access_token(
 
 
 @router.post("/test-token", response_model=UserPublic)
-def test_token(current_user: CurrentUser) -> Any:
+def test_token(current_user: CurrentUserRecord) -> Any:
     """Test access token."""
     return current_user
@@ -1,15 +1,18 @@
 import uuid
+from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from pydantic_core import to_json
 from sqlmodel import col, func, select
 
 from scholark.api.deps import CurrentUser, LimitParam, SessionDep, SkipParam
+from scholark.api.serialization import json_response, public_columns, row_dicts
 from scholark.models import Tag, TagCreate, TagPublic, TagsPublic, TagUpdate
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
-@router.get("/")
+@router.get("/", response_model=TagsPublic)
 def read_tags(
     session: SessionDep,
     current_user: CurrentUser,
@@ -17,22 +20,20 @@ def read_tags(
     skip: SkipParam = 0,
     limit: LimitParam = 100,
     all_users: bool = False,
-) -> TagsPublic:
+) -> Any:
     """Retrieve a list of tags."""
+    statement = select(*public_columns(Tag, TagPublic))
     if current_user.is_superuser and all_users:
         count_statement = select(func.count()).select_from(Tag)
-        statement = select(Tag).order_by(col(Tag.name)).offset(skip).limit(limit)
     else:
         # For non-superuser, filter by user_id
         count_statement = select(func.count()).select_from(Tag).where(Tag.user_id == current_user.id)
-        statement = select(Tag).where(Tag.user_id == current_user.id).order_by(col(Tag.name)).offset(skip).limit(limit)
+        statement = statement.where(Tag.user_id == current_user.id)
 
     count = session.exec(count_statement).one()
-    tags = session.exec(statement).all()
+    tags = row_dicts(session.execute(statement.order_by(col(Tag.name)).offset(skip).limit(limit)))
 
-    tags_public = [TagPublic.model_validate(tag) for tag in tags]
-
-    return TagsPublic(data=tags_public, count=count)
+    return json_response(to_json({"data": tags, "count": count}))
 
 
 @router.post("/", response_model=TagPublic)
@@ -1,18 +1,24 @@
 import uuid
+from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from pydantic_core import to_json
+from sqlmodel import col, func, select, update
 
 from scholark.api.deps import (
     AuthProviderDep,
     CurrentUser,
+    CurrentUserRecord,
     LimitParam,
     SessionDep,
     SkipParam,
     get_current_active_superuser,
 )
+from scholark.api.serialization import json_response, public_columns, row_dicts
+from scholark.core import invalidation
 from scholark.models import (
+    Conference,
     Message,
     User,
     UserCreate,
@@ -35,12 +41,10 @@ def read_users(session: SessionDep, skip: SkipParam = 0, limit: LimitParam = 100
     count_statement = select(func.count()).select_from(User)
     count = session.exec(count_statement).one()
 
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
+    statement = select(*public_columns(User, UserPublic)).offset(skip).limit(limit)
+    users = row_dicts(session.execute(statement))
 
-    users_public = [UserPublic.model_validate(user) for user in users]
-
-    return UsersPublic(data=users_public, count=count)
+    return json_response(to_json({"data": users, "count": count}))
 
 
 @router.post(
@@ -48,20 +52,20 @@ def read_users(session: SessionDep, skip: SkipParam = 0, limit: LimitParam = 100
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UserPublic,
 )
-def create_user(*, user_in: UserCreate, auth_provider: AuthProviderDep) -> Any:
+def create_user(*, session: SessionDep, user_in: UserCreate, auth_provider: AuthProviderDep) -> Any:
     """Create new user."""
-    user = auth_provider.get_user_by_username(username=user_in.username)
+    user = auth_provider.get_user_by_username(session, username=user_in.username)
     if user is not None:
         raise HTTPException(
             status_code=400,
             detail="A user with this username already exists in the system.",
         )
 
-    return auth_provider.create_user(user_create=user_in)
+    return auth_provider.create_user(session, user_create=user_in)
 
 
 @router.get("/me", response_model=UserPublic)
-def read_user_me(current_user: CurrentUser) -> Any:
+def read_user_me(current_user: CurrentUserRecord) -> Any:
     """Get current user."""
     return current_user
 
@@ -70,29 +74,30 @@ def read_user_me(current_user: CurrentUser) -> Any:
 def update_user_me(
     *,
     session: SessionDep,
-    current_user: CurrentUser,
+    current_user: CurrentUserRecord,
     user_in: UserUpdateMe,
 ) -> Any:
     """Update the current user's profile."""
     update_dict = user_in.model_dump(exclude_unset=True)
     current_user.sqlmodel_update(update_dict)
     session.add(current_user)
+    invalidation.publish(session, "user", current_user.id)
     session.commit()
     session.refresh(current_user)
     return current_user
 
 
 @router.post("/signup", response_model=UserPublic)
-def register_user(auth_provider: AuthProviderDep, user_in: UserRegister) -> Any:
+def register_user(session: SessionDep, auth_provider: AuthProviderDep, user_in: UserRegister) -> Any:
     """Create new user without the need to be logged in."""
-    user = auth_provider.get_user_by_username(username=user_in.username)
+    user = auth_provider.get_user_by_username(session, username=user_in.username)
     if user is not None:
         raise HTTPException(
             status_code=400,
             detail="A user with this username already exists in the system",
         )
     user_create = UserCreate.model_validate(user_in)
-    return auth_provider.create_user(user_create=user_create)
+    return auth_provider.create_user(session, user_create=user_create)
 
 
 @router.get("/{user_id}", response_model=UserPublic)
@@ -130,6 +135,22 @@ def delete_user(
             status_code=403,
             detail="Super users are not allowed to delete themselves",
         )
+    # Detach the user's conferences here rather than leaving it to ON DELETE
+    # SET NULL, so their updated_at moves and validators, the changes feed and
+    # conference_cache all see the new creator.
+    conference_ids = (
+        session.exec(
+            update(Conference)
+            .where(col(Conference.created_by_user_id) == user.id)
+            .values(created_by_user_id=None, updated_at=datetime.now(UTC))
+            .returning(col(Conference.id)),
+        )
+        .scalars()
+        .all()
+    )
+    for conference_id in conference_ids:
+        invalidation.publish(session, "conference", conference_id)
+    invalidation.publish(session, "user", user.id)
     session.delete(user)
     session.commit()
     return Message(message="User deleted successfully")
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from sqlmodel import Session
+
 from scholark.models import User, UserCreate
 
 
@@ -17,14 +19,20 @@ class AuthProviderError(Exception):
 
 
 class AuthProvider(ABC):
+    """Authenticates and creates users.
+
+    One instance serves the whole process (see registry.auth_provider), so
+    it owns long-lived resources and takes each request's session per call.
+    """
+
     @abstractmethod
-    def authenticate(self, username: str, password: str) -> User | None:
+    def authenticate(self, session: Session, username: str, password: str) -> User | None:
         """Authenticate a user with username and password."""
 
     @abstractmethod
-    def get_user_by_username(self, *, username: str) -> User | None:
+    def get_user_by_username(self, session: Session, *, username: str) -> User | None:
         """Get a user by username."""
 
     @abstractmethod
-    def create_user(self, *, user_create: UserCreate) -> User:
+    def create_user(self, session: Session, *, user_create: UserCreate) -> User:
         """Create a new user."""
@@ -10,7 +10,7 @@ from .base import AuthProvider, AuthProviderError
 
 
 @lru_cache(maxsize=1)
-def _dummy_password_hash() -> str:
+def dummy_password_hash() -> str:
     """Hash to verify against when a username has no credential.
 
     Verifying a dummy hash keeps the response time of unknown-username logins
@@ -20,17 +20,14 @@ def _dummy_password_hash() -> str:
 
 
 class DbAuthProvider(AuthProvider):
-    def __init__(self, db: Session) -> None:
-        self.db = db
+    def get_user_by_username(self, session: Session, *, username: str) -> User | None:
+        return session.exec(select(User).where(User.username == username)).first()
 
-    def get_user_by_username(self, *, username: str) -> User | None:
-        return self.db.exec(select(User).where(User.username == username)).first()
-
-    def create_user(self, *, user_create: UserCreate) -> User:
+    def create_user(self, session: Session, *, user_create: UserCreate) -> User:
         if user_create.password is None:
             raise AuthProviderError(status_code=400, detail="Password is required")
 
-        existing_user = self.db.exec(select(User).where(User.username == user_create.username)).one_or_none()
+        existing_user = session.exec(select(User).where(User.username == user_create.username)).one_or_none()
         if existing_user:
             raise AuthProviderError(status_code=400, detail="User already exists")
 
@@ -46,37 +43,57 @@ class DbAuthProvider(AuthProvider):
 
         # One transaction: committing the user without its credential would
         # strand a username that exists but can never authenticate.
-        self.db.add(new_user)
+        session.add(new_user)
         try:
             # Flush the user row first so the credential's FK target exists;
             # there is no ORM relationship between the two, so SQLAlchemy
             # cannot order the inserts on its own. flush() does not commit.
-            self.db.flush()
-            self.db.add(new_cred)
-            self.db.commit()
+            session.flush()
+            session.add(new_cred)
+            session.commit()
         except IntegrityError as e:
-            self.db.rollback()
+            session.rollback()
             raise AuthProviderError(status_code=400, detail="User already exists") from e
         except Exception as e:
-            self.db.rollback()
+            session.rollback()
             raise AuthProviderError(status_code=500, detail="Database error") from e
 
-        self.db.refresh(new_user)
+        session.refresh(new_user)
 
         return new_user
 
-    def authenticate(self, username: str, password: str) -> User | None:
-        db_user = self.db.exec(select(User).where(User.username == username)).one_or_none()
+    def authenticate(self, session: Session, username: str, password: str) -> User | None:
+        """Verify the password against the user's stored hash.
+
+        If the call began the session's transaction and the session has no
+        pending changes, the transaction is rolled back before hashing, so
+        the connection goes back to the pool instead of being held for the
+        hash. The returned user stays loaded, and no other state is
+        discarded. A transaction the caller already had open is left alone.
+        """
+        # Checked before the queries, whose autoflush would write pending changes.
+        releasable = not (session.in_transaction() or session.new or session.dirty or session.deleted)
+        db_user = session.exec(select(User).where(User.username == username)).one_or_none()
         db_cred = None
         if db_user:
-            db_cred = self.db.exec(
+            db_cred = session.exec(
                 select(DbAuthCredential).where(DbAuthCredential.user_id == db_user.id),
             ).one_or_none()
-
-        if db_cred is None:
-            verify_password(password, _dummy_password_hash())
+        hashed_password = db_cred.hashed_password if db_cred is not None else None
+
+        if releasable:
+            # Detached for the rollback, which would expire it and cost the
+            # caller a SELECT on first access; re-added unchanged after.
+            if db_user is not None:
+                session.expunge(db_user)
+            session.rollback()
+            if db_user is not None:
+                session.add(db_user)
+
+        if hashed_password is None:
+            verify_password(password, dummy_password_hash())
             return None
-        if not verify_password(password, db_cred.hashed_password):
+        if not verify_password(password, hashed_password):
             return None
 
         return db_user
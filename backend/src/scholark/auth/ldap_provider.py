@@ -1,30 +1,43 @@
-from ldap3 import Connection
+import contextlib
+import hashlib
+import hmac
+import secrets
+import time
+
+from ldap3 import NONE, Connection, Server
+from ldap3.core.exceptions import LDAPCommunicationError, LDAPException
 from ldap3.utils.dn import escape_rdn
 from sqlmodel import Session, select
 
+from scholark.core.cache import LRUCache
+from scholark.core.config import settings
 from scholark.models import User, UserCreate, default_tags
 
 from .base import AuthProvider, AuthProviderError
 
+BIND_CACHE_SIZE = 10_000
+
 
 class LdapAuthProvider(AuthProvider):
-    def __init__(
-        self,
-        db: Session,
-        ldap_server: str,
-        dn_pattern: str,
-    ) -> None:
-        self.db = db
-        self.ldap_server = ldap_server
+    def __init__(self, ldap_server: str, dn_pattern: str) -> None:
         self.dn_pattern = dn_pattern
+        # Shared by every bind. get_info=NONE skips the schema and root DSE
+        # reads, which a bind does not need.
+        self.server = Server(ldap_server, get_info=NONE, connect_timeout=settings.LDAP_CONNECT_TIMEOUT.total_seconds())
+        # Successful binds, keyed by an HMAC of the DN and password under a
+        # key that never leaves this process, and stored with the
+        # time.monotonic() they expire at. Neither the passwords nor an
+        # unsalted hash of them is kept.
+        self.bind_cache: LRUCache[bytes, float] = LRUCache(BIND_CACHE_SIZE)
+        self._bind_cache_key = secrets.token_bytes(32)
 
-    def get_user_by_username(self, *, username: str) -> User | None:
-        return self.db.exec(select(User).where(User.username == username)).first()
+    def get_user_by_username(self, session: Session, *, username: str) -> User | None:
+        return session.exec(select(User).where(User.username == username)).first()
 
-    def create_user(self, *, user_create: UserCreate) -> User:  # noqa: ARG002
+    def create_user(self, session: Session, *, user_create: UserCreate) -> User:  # noqa: ARG002
         raise AuthProviderError(status_code=400, detail="LDAP user creation not supported")
 
-    def authenticate(self, username: str, password: str) -> User | None:
+    def authenticate(self, session: Session, username: str, password: str) -> User | None:
         # An empty password would raise LDAPPasswordIsMandatoryError at bind,
         # and LDAP servers permitting unauthenticated binds would treat it as
         # a successful anonymous bind - a classic authentication bypass.
@@ -34,22 +47,47 @@ class LdapAuthProvider(AuthProvider):
         # Escape DN metacharacters so a crafted username cannot alter the DN
         # structure (e.g. "foo,ou=admins").
         user_dn = self.dn_pattern.format(username=escape_rdn(username))
-        conn = Connection(self.ldap_server, user=user_dn, password=password)
-
-        if not conn.bind():
+        if not self._bind(user_dn, password):
             return None  # Authentication failed
 
         # Add user to the database if they don't exist
-        db_user = self.db.exec(select(User).where(User.username == username)).one_or_none()
+        db_user = session.exec(select(User).where(User.username == username)).one_or_none()
         if not db_user:
             db_user = User(username=username)
             db_user.tags.extend(default_tags(user_id=db_user.id))
-            self.db.add(db_user)
+            session.add(db_user)
             try:
-                self.db.commit()
+                session.commit()
             except Exception as e:
-                self.db.rollback()
+                session.rollback()
                 raise AuthProviderError(status_code=500, detail="Database error") from e
-            self.db.refresh(db_user)
+            session.refresh(db_user)
 
         return db_user
+
+    def _bind(self, user_dn: str, password: str) -> bool:
+        """Check the credentials with a bind, unless one recently succeeded."""
+        entry = hmac.digest(self._bind_cache_key, f"{user_dn}\0{password}".encode(), hashlib.sha256)
+        expires_at = self.bind_cache.get(entry)
+        if expires_at is not None and expires_at > time.monotonic():
+            return True
+
+        conn = Connection(
+            self.server,
+            user=user_dn,
+            password=password,
+            receive_timeout=settings.LDAP_RECEIVE_TIMEOUT.total_seconds(),
+        )
+        try:
+            bound = bool(conn.bind())
+        except LDAPCommunicationError as e:
+            raise AuthProviderError(status_code=503, detail="LDAP server unavailable") from e
+        finally:
+            # After a communication error the socket may already be gone.
+            with contextlib.suppress(LDAPException):
+                conn.unbind()
+
+        ttl = settings.LDAP_BIND_CACHE_TTL.total_seconds()
+        if bound and ttl > 0:
+            self.bind_cache.set(entry, time.monotonic() + ttl)
+        return bound
@@ -0,0 +1,38 @@
+"""The auth provider of the process, built once from the settings.
+
+Providers take the session per call, so a single instance serves every
+request and owns what should outlive one, such as the LDAP server definition
+and its bind cache. The app builds it while warming up, so a configuration
+error stops the start-up rather than failing the first login.
+"""
+
+import functools
+
+from scholark.core.config import settings
+
+from .base import AuthProvider, AuthProviderError
+from .db_provider import DbAuthProvider
+from .ldap_provider import LdapAuthProvider
+from .router import AuthRouter
+
+
+@functools.cache
+def auth_provider() -> AuthProvider:
+    match settings.AUTH_PROVIDER:
+        case "db":
+            return DbAuthProvider()
+        case "ldap":
+            # Not asserts: those vanish under python -O and this is a
+            # deployment configuration error worth a clear message.
+            if not settings.LDAP_SERVER or not settings.LDAP_DN_PATTERN:
+                raise AuthProviderError(
+                    status_code=500,
+                    detail="LDAP auth is enabled but SCHOLARK_LDAP_SERVER or SCHOLARK_LDAP_DN_PATTERN is not set",
+                )
+            return AuthRouter(
+                db_provider=DbAuthProvider(),
+                ldap_provider=LdapAuthProvider(settings.LDAP_SERVER, settings.LDAP_DN_PATTERN),
+                preserved_db_usernames=settings.PRESERVED_DB_USERNAMES,
+            )
+        case _:
+            raise AuthProviderError(status_code=500, detail=f"Unknown auth provider: {settings.AUTH_PROVIDER}")
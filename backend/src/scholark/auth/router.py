@@ -1,5 +1,7 @@
 from collections.abc import Collection
 
+from sqlmodel import Session
+
 from scholark.models import User, UserCreate
 
 from .base import AuthProvider, AuthProviderError
@@ -18,18 +20,18 @@ class AuthRouter(AuthProvider):
         self.ldap_provider = ldap_provider
         self.preserved_db_usernames = set(preserved_db_usernames)
 
-    def authenticate(self, username: str, password: str) -> User | None:
+    def authenticate(self, session: Session, username: str, password: str) -> User | None:
         if username in self.preserved_db_usernames:
-            return self.db_provider.authenticate(username, password)
-        return self.ldap_provider.authenticate(username, password)
+            return self.db_provider.authenticate(session, username, password)
+        return self.ldap_provider.authenticate(session, username, password)
 
-    def create_user(self, *, user_create: UserCreate) -> User:
+    def create_user(self, session: Session, *, user_create: UserCreate) -> User:
         if user_create.username in self.preserved_db_usernames:
-            return self.db_provider.create_user(user_create=user_create)
+            return self.db_provider.create_user(session, user_create=user_create)
         raise AuthProviderError(status_code=400, detail="User creation not supported for this username")
 
-    def get_user_by_username(self, *, username: str) -> User | None:
+    def get_user_by_username(self, session: Session, *, username: str) -> User | None:
         # Look up user from wherever needed
         if username in self.preserved_db_usernames:
-            return self.db_provider.get_user_by_username(username=username)
-        return self.ldap_provider.get_user_by_username(username=username)
+            return self.db_provider.get_user_by_username(session, username=username)
+        return self.ldap_provider.get_user_by_username(session, username=username)
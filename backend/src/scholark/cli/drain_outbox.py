@@ -0,0 +1,52 @@
+"""Send queued Slack channel notifications from the outbox.
+
+Runs until interrupted, or with --once until the outbox has no due messages.
+
+Usage:
+    uv run python -m scholark.cli.drain_outbox [--once] [--poll-interval SECONDS]
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from sqlmodel import Session
+
+from scholark.core.db import engine
+from scholark.outbox import drain_all
+from scholark.slack import _get_slack_client
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Send queued Slack channel notifications.")
+    parser.add_argument("--once", action="store_true", help="exit once no message is due")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="seconds between polls of an empty outbox")
+    args = parser.parse_args()
+
+    client = _get_slack_client()
+    if client is None:
+        logger.info("Slack not configured, not draining the outbox")
+        return
+
+    logger.info("Starting outbox worker")
+    try:
+        while True:
+            with Session(engine) as session:
+                drain_all(session, client)
+            if args.once:
+                break
+            time.sleep(args.poll_interval)
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        logger.exception("Fatal error in outbox worker")
+        sys.exit(1)
+    logger.info("Outbox worker stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Recompute the milestone reminder schedule, e.g. after changing REMINDER_OFFSETS_DAYS.
+
+Usage:
+    uv run python -m scholark.cli.rebuild_reminder_schedule
+"""
+
+import logging
+import sys
+
+from sqlmodel import Session
+
+from scholark.core.db import engine
+from scholark.reminders import rebuild_schedule
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logger.info("Rebuilding the reminder schedule")
+    try:
+        with Session(engine) as session:
+            count = rebuild_schedule(session)
+            session.commit()
+    except Exception:
+        logger.exception("Fatal error while rebuilding the reminder schedule")
+        sys.exit(1)
+    logger.info(f"Scheduled {count} reminders")
+
+
+if __name__ == "__main__":
+    main()
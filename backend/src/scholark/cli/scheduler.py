@@ -0,0 +1,61 @@
+"""Run the milestone reminder and outbox jobs on a schedule until stopped.
+
+Keeps the engine and the Slack client warm between runs; with several
+replicas, each job still runs in only one of them at a time.
+
+Usage:
+    uv run python -m scholark.cli.scheduler
+"""
+
+import logging
+import signal
+from functools import partial
+
+from sqlmodel import select
+
+from scholark.core.config import settings
+from scholark.core.db import engine
+from scholark.outbox import drain_all
+from scholark.scheduler import Job, Scheduler
+from scholark.slack import _get_slack_client, send_milestone_reminders
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    client = _get_slack_client()
+    if client is None:
+        logger.info("Slack not configured, nothing to schedule")
+        return
+
+    # Fail fast on a bad database configuration, and open the first pooled connection.
+    with engine.connect() as connection:
+        connection.execute(select(1))
+
+    scheduler = Scheduler(
+        engine,
+        [
+            Job(
+                "milestone-reminders",
+                settings.SCHEDULER_REMINDER_INTERVAL,
+                # Each run evaluates the timezones not yet evaluated for their
+                # current local date, so a timezone is caught up after downtime
+                # or a run that raised; the delivery log keeps reruns, here or
+                # on another replica, from sending twice.
+                partial(send_milestone_reminders, evaluated={}),
+            ),
+            Job("outbox", settings.SCHEDULER_OUTBOX_INTERVAL, partial(drain_all, client=client)),
+        ],
+    )
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: scheduler.stop())
+
+    logger.info("Starting scheduler")
+    scheduler.start()
+    scheduler.join()
+    logger.info("Scheduler stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,59 @@
 """Send milestone reminders to subscribed users via Slack DM.
 
+Prints the run's metrics to stdout as JSON, and with --metrics-file also
+writes them in the Prometheus text format, e.g. for node_exporter's
+textfile collector. --dry-run builds every message without sending any,
+to measure the job against a dataset.
+
 Usage:
-    uv run python -m scholark.cli.send_reminders
+    uv run python -m scholark.cli.send_reminders [--dry-run] [--metrics-file PATH]
 """
 
+import argparse
+import dataclasses
+import json
 import logging
 import sys
+import time
+from pathlib import Path
 
 from sqlmodel import Session
 
 from scholark.core.db import engine
-from scholark.slack import send_milestone_reminders
+from scholark.slack import ReminderRunMetrics, send_milestone_reminders
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+METRIC_PREFIX = "scholark_reminders"
+
+
+def write_prometheus_textfile(path: Path, metrics: ReminderRunMetrics) -> None:
+    """Write the metrics as gauges, atomically so a scrape never sees a partial file."""
+    labels = f'{{dry_run="{str(metrics.dry_run).lower()}"}}'
+    values = {name: value for name, value in dataclasses.asdict(metrics).items() if name != "dry_run"}
+    values["last_run_timestamp_seconds"] = time.time()
+    lines = []
+    for name, value in values.items():
+        lines += [f"# TYPE {METRIC_PREFIX}_{name} gauge", f"{METRIC_PREFIX}_{name}{labels} {value}"]
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_text("\n".join(lines) + "\n")
+    temporary.replace(path)
+
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Send milestone reminders via Slack DM.")
+    parser.add_argument("--dry-run", action="store_true", help="build the messages without sending them")
+    parser.add_argument("--metrics-file", type=Path, help="also write the metrics to this Prometheus textfile")
+    args = parser.parse_args()
+
     logger.info("Starting milestone reminder job")
     try:
         with Session(engine) as session:
-            send_milestone_reminders(session)
+            metrics = send_milestone_reminders(session, dry_run=args.dry_run)
+        print(json.dumps(dataclasses.asdict(metrics)))  # noqa: T201
+        if args.metrics_file is not None:
+            write_prometheus_textfile(args.metrics_file, metrics)
     except Exception:
         logger.exception("Fatal error in milestone reminder job")
         sys.exit(1)
@@ -0,0 +1,75 @@
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from scholark.core import invalidation
+from scholark.core.config import settings
+
+
+class LRUCache[K, V]:
+    """Thread-safe, size-bounded least-recently-used cache.
+
+    Sync endpoints run in a thread pool, so every operation holds a lock.
+    A maxsize of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# The user-independent part of ConferencePublic (every field but tags and
+# is_subscribed) encoded as one JSON object, keyed by conference id and
+# stored with the updated_at it was built from. Readers compare that against the current
+# updated_at, so an entry is never served once the conference has changed,
+# even if the write happened elsewhere; invalidation frees the memory early.
+conference_cache: LRUCache[uuid.UUID, tuple[datetime, bytes]] = LRUCache(settings.CONFERENCE_CACHE_SIZE)
+invalidation.subscribe("conference", conference_cache, uuid.UUID)
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """The fields of a User that authorisation depends on."""
+
+    id: uuid.UUID
+    disabled: bool
+    is_superuser: bool
+    role: str
+
+
+# The authenticated user behind a token, keyed by user id and stored with the
+# time.monotonic() it expires at. Writes publish "user" invalidations; the
+# expiry bounds staleness for changes made outside the API, and for a read
+# that races a write and caches the old row just after it was invalidated.
+user_cache: LRUCache[uuid.UUID, tuple[float, AuthenticatedUser]] = LRUCache(settings.USER_CACHE_SIZE)
+invalidation.subscribe("user", user_cache, uuid.UUID)
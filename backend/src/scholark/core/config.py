@@ -1,7 +1,7 @@
 from datetime import timedelta
 from typing import Annotated, Any, Literal
 
-from pydantic import AnyUrl, BeforeValidator, Field, PostgresDsn, computed_field
+from pydantic import AnyUrl, BeforeValidator, Field, NonNegativeInt, PositiveInt, PostgresDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -52,19 +52,74 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    # Connections the engine's pool opens at start-up, so the first requests
+    # do not pay for connecting; capped at the pool size (5), the most it
+    # keeps open between uses.
+    DB_WARM_CONNECTIONS: NonNegativeInt = 5
+
     FIRST_SUPERUSER: str
     FIRST_SUPERUSER_PASSWORD: str
 
+    # The conference changes feed only reports rows whose updated_at is at
+    # least this old, so a write that commits after a poll (with updated_at
+    # set before it) is still seen by the next poll. Must exceed the longest
+    # write transaction plus the clock skew between backend hosts.
+    CHANGES_SAFETY_MARGIN: timedelta = Field(default=timedelta(seconds=10))
+
+    # Entries in the per-process cache of conference list items; 0 disables it.
+    CONFERENCE_CACHE_SIZE: int = 10_000
+    # Entries in the per-process cache of authenticated users' authorisation
+    # fields; 0 disables it. Writes through the API invalidate entries at
+    # once; the TTL bounds how long any other change (e.g. a user disabled
+    # directly in the database) takes to be seen.
+    USER_CACHE_SIZE: int = 10_000
+    USER_CACHE_TTL: timedelta = Field(default=timedelta(seconds=30))
+
+    # bcrypt runs on this many dedicated threads, so a burst of logins cannot
+    # take up the whole request thread pool. Once this many more requests
+    # are waiting for one, logins and sign-ups are answered 503 at once.
+    PASSWORD_HASH_WORKERS: PositiveInt = 4
+    PASSWORD_HASH_QUEUE_DEPTH: NonNegativeInt = 16
+
     AUTH_PROVIDER: Literal["db", "ldap"] = "db"  # "db" or "ldap"
     PRESERVED_DB_USERNAMES: set[str] = {"admin"}
     LDAP_SERVER: str | None = None
     LDAP_DN_PATTERN: str | None = None
+    # How long to wait for the LDAP server to accept a connection, and then
+    # to answer a bind.
+    LDAP_CONNECT_TIMEOUT: timedelta = Field(default=timedelta(seconds=5))
+    LDAP_RECEIVE_TIMEOUT: timedelta = Field(default=timedelta(seconds=10))
+    # How long a successful LDAP bind is remembered, so repeated logins with
+    # the same credentials skip the directory; 0 disables it. A password
+    # changed or an account locked in the directory is only seen once the
+    # remembered bind expires.
+    LDAP_BIND_CACHE_TTL: timedelta = Field(default=timedelta(0))
 
     # Slack integration (optional)
     SLACK_BOT_TOKEN: str | None = None
     SLACK_CHANNEL_ID: str | None = None
-    # IANA timezone used to compute "today" for milestone reminders.
+    # Reminder DMs are sent by this many threads, started at most
+    # SLACK_MESSAGES_PER_SECOND per second overall (Slack additionally allows
+    # about one message per second per channel, which is always enforced).
+    SLACK_MAX_CONCURRENCY: int = Field(default=4, ge=1)
+    SLACK_MESSAGES_PER_SECOND: float = Field(default=5.0, gt=0)
+    # Attempts per message after a rate limit, server or connection error.
+    SLACK_MAX_RETRIES: int = Field(default=5, ge=0)
+    # IANA timezone used to compute "today" for the milestone reminders of
+    # users who have not set their own timezone.
     REMINDER_TIMEZONE: str = "UTC"
+    # Days before a milestone that reminders are sent. The reminder schedule
+    # is precomputed, so rebuild it after changing this
+    # (python -m scholark.cli.rebuild_reminder_schedule).
+    REMINDER_OFFSETS_DAYS: list[PositiveInt] = [30, 7]
+    # Send each user one DM per run listing all their due milestones,
+    # instead of one DM per milestone.
+    REMINDER_DIGEST: bool = False
+
+    # How often the scheduler (python -m scholark.cli.scheduler) runs each job.
+    # Reminders are logged once delivered, so hourly runs send each only once.
+    SCHEDULER_REMINDER_INTERVAL: timedelta = Field(default=timedelta(hours=1))
+    SCHEDULER_OUTBOX_INTERVAL: timedelta = Field(default=timedelta(seconds=5))
 
 
 # Missing argument is intentional to allow environment variables to populate the settings.
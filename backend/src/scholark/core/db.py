@@ -30,4 +30,4 @@ def init_db(session: Session) -> None:
             password=settings.FIRST_SUPERUSER_PASSWORD,
             is_superuser=True,
         )
-        user = DbAuthProvider(session).create_user(user_create=user_in)
+        user = DbAuthProvider().create_user(session, user_create=user_in)
@@ -0,0 +1,134 @@
+"""Cross-worker cache invalidation over PostgreSQL LISTEN/NOTIFY.
+
+Write paths call publish() before committing. The invalidation is sent with
+NOTIFY inside the same transaction, so other workers hear it exactly when
+the write becomes visible (and never for a rolled-back write), and applied
+to this process's caches after the commit. Each worker runs an
+InvalidationListener that applies the notifications it receives.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import psycopg
+from sqlalchemy import Engine, event, text
+from sqlalchemy.orm import SessionTransaction
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "scholark_cache_invalidation"
+
+_PENDING_KEY = "scholark_invalidations"
+
+
+class InvalidatableCache(Protocol):
+    def invalidate(self, key: Any) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    cache: InvalidatableCache
+    parse_key: Callable[[str], Hashable]
+
+
+_subscriptions: defaultdict[str, list[_Subscription]] = defaultdict(list)
+
+
+def subscribe(kind: str, cache: InvalidatableCache, parse_key: Callable[[str], Hashable] = str) -> None:
+    """Invalidate entries of the cache when invalidations of the given kind are published."""
+    _subscriptions[kind].append(_Subscription(cache, parse_key))
+
+
+def publish(session: Session, kind: str, key: object) -> None:
+    """Invalidate the key in every worker's caches once the session commits."""
+    if not session.in_transaction():
+        # Rollback events only fire for a transaction that has begun.
+        session.begin()
+    session.info.setdefault(_PENDING_KEY, []).append(f"{kind}:{key}")
+
+
+def apply(payload: str) -> None:
+    """Apply a "<kind>:<key>" payload to this process's caches."""
+    kind, _, key = payload.partition(":")
+    for subscription in _subscriptions.get(kind, ()):
+        try:
+            subscription.cache.invalidate(subscription.parse_key(key))
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation %r", payload)
+
+
+def clear_all() -> None:
+    """Drop every subscribed cache, for when notifications may have been missed."""
+    for subscriptions in _subscriptions.values():
+        for subscription in subscriptions:
+            subscription.cache.clear()
+
+
+@event.listens_for(Session, "before_commit")
+def _notify(session: Session) -> None:
+    payloads = session.info.get(_PENDING_KEY)
+    if not payloads or session.get_bind().dialect.name != "postgresql":
+        return
+    # NOTIFY is transactional: it is delivered on commit, and only then.
+    for payload in dict.fromkeys(payloads):
+        session.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": payload})
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_local(session: Session) -> None:
+    for payload in dict.fromkeys(session.info.pop(_PENDING_KEY, ())):
+        apply(payload)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard(session: Session, previous_transaction: SessionTransaction) -> None:
+    # Rolling back to a savepoint keeps the outer transaction's invalidations.
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_KEY, None)
+
+
+class InvalidationListener:
+    """Background thread applying invalidations published by any worker.
+
+    It holds one dedicated connection outside the engine's pool. Whenever
+    that connection is lost, notifications may have been missed in the
+    meantime, so all subscribed caches are cleared after reconnecting.
+    """
+
+    def __init__(self, engine: Engine, *, poll_interval: float = 1.0, retry_interval: float = 5.0) -> None:
+        self._conninfo = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        self._poll_interval = poll_interval
+        self._retry_interval = retry_interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation-listener", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=self._poll_interval + 1)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except psycopg.Error:
+                logger.exception("Cache invalidation listener lost its connection; retrying.")
+                self._stop.wait(self._retry_interval)
+
+    def _listen(self) -> None:
+        with psycopg.connect(self._conninfo, autocommit=True) as connection:
+            connection.execute(f"LISTEN {CHANNEL}")
+            # Anything published before LISTEN took effect was missed.
+            clear_all()
+            while not self._stop.is_set():
+                for notify in connection.notifies(timeout=self._poll_interval):
+                    apply(notify.payload)
@@ -1,3 +1,7 @@
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -15,11 +19,40 @@ def create_access_token(subject: str | Any, expires_delta: timedelta = settings.
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
+class PasswordHashingBusyError(Exception):
+    """Too many requests are already waiting to hash a password."""
+
+
+class HashingPool:
+    """Dedicated threads for bcrypt, with a bound on waiting callers.
+
+    bcrypt releases the GIL, so threads hash in parallel. Callers block until
+    their hash is done, which bounds how many request threads can be tied up
+    by hashing; past that bound they are turned away instead of queueing.
+    """
+
+    def __init__(self, workers: int, queue_depth: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    def run[T](self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusyError
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+
+@functools.cache
+def hashing_pool() -> HashingPool:
+    return HashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_DEPTH)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    return hashing_pool().run(bcrypt.checkpw, plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
 def get_password_hash(password: str) -> str:
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
+    hashed = hashing_pool().run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
     return hashed.decode("utf-8")
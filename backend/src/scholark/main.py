@@ -2,7 +2,7 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
@@ -12,6 +12,9 @@ from scholark.api.main import api_router
 from scholark.auth.base import AuthProviderError
 from scholark.core.config import settings
 from scholark.core.db import engine, init_db
+from scholark.core.invalidation import InvalidationListener
+from scholark.core.security import PasswordHashingBusyError
+from scholark.core.warmup import warm_up
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +24,7 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     with Session(engine) as session:
         # Test database connection
         try:
@@ -42,7 +45,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
                 "automatically when SCHOLARK_DB_AUTO_MIGRATE=true).",
             )
             raise
-    yield
+
+    warm_up(app, engine, settings.DB_WARM_CONNECTIONS)
+
+    # Other workers' writes reach this process's caches through NOTIFY.
+    listener = InvalidationListener(engine) if engine.dialect.name == "postgresql" else None
+    if listener is not None:
+        listener.start()
+    try:
+        yield
+    finally:
+        if listener is not None:
+            listener.stop()
 
 
 app = FastAPI(
@@ -67,6 +81,16 @@ def auth_provider_error_handler(request: Request, exc: AuthProviderError) -> JSO
     return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
 
 
+@app.exception_handler(PasswordHashingBusyError)
+def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusyError) -> JSONResponse:  # noqa: ARG001
+    # Shed the load at once rather than let logins queue behind each other.
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many sign-in attempts in progress, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 if __name__ == "__main__":
@@ -3,9 +3,10 @@ from datetime import UTC, datetime
 from datetime import date as date_
 from datetime import time as time_
 from typing import Annotated
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import sqlalchemy as sa
-from pydantic import StringConstraints, computed_field
+from pydantic import AfterValidator, StringConstraints, computed_field
 from sqlmodel import Field, Relationship, SQLModel
 
 # Validation applies to the create/update payload models only: table models
@@ -15,17 +16,74 @@ HexColor = Annotated[str, StringConstraints(pattern=r"^#([0-9a-fA-F]{3}|[0-9a-fA
 NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
+def _check_timezone(name: str) -> str:
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        msg = f"Unknown timezone: {name}"
+        raise ValueError(msg) from None
+    return name
+
+
+# An IANA timezone name, such as "Asia/Tokyo".
+Timezone = Annotated[str, AfterValidator(_check_timezone)]
+
+
 class TagConferenceLink(SQLModel, table=True):
     tag_id: uuid.UUID = Field(foreign_key="tag.id", primary_key=True, ondelete="CASCADE")
-    conference_id: uuid.UUID = Field(foreign_key="conference.id", primary_key=True, ondelete="CASCADE")
+    # Not covered by the (tag_id, conference_id) primary key.
+    conference_id: uuid.UUID = Field(foreign_key="conference.id", primary_key=True, ondelete="CASCADE", index=True)
 
 
 class ConferenceSubscription(SQLModel, table=True):
     user_id: uuid.UUID = Field(foreign_key="user.id", primary_key=True, ondelete="CASCADE")
-    conference_id: uuid.UUID = Field(foreign_key="conference.id", primary_key=True, ondelete="CASCADE")
+    # Not covered by the (user_id, conference_id) primary key.
+    conference_id: uuid.UUID = Field(foreign_key="conference.id", primary_key=True, ondelete="CASCADE", index=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC), sa_type=sa.DateTime(timezone=True))  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
 
 
+# Milestone reminders already delivered, so reruns of the reminder job skip
+# them. The primary key makes each (user, milestone, offset) reminder unique;
+# rescheduling a milestone to another date clears its rows.
+class ReminderDelivery(SQLModel, table=True):
+    user_id: uuid.UUID = Field(foreign_key="user.id", primary_key=True, ondelete="CASCADE")
+    # Not covered by the (user_id, milestone_id, offset_days) primary key.
+    milestone_id: uuid.UUID = Field(
+        foreign_key="conferencemilestone.id",
+        primary_key=True,
+        ondelete="CASCADE",
+        index=True,
+    )
+    # Days before the milestone the reminder was due (see REMINDER_OFFSETS_DAYS).
+    offset_days: int = Field(primary_key=True)
+    delivered_at: datetime = Field(default_factory=lambda: datetime.now(UTC), sa_type=sa.DateTime(timezone=True))  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
+
+
+# Reminder schedule: one row per milestone and reminder offset, dated the day
+# the reminder is due, so the reminder job looks up a day's reminders by
+# due_date. Kept in step with milestone writes by scholark.reminders.
+class ReminderDue(SQLModel, table=True):
+    milestone_id: uuid.UUID = Field(foreign_key="conferencemilestone.id", primary_key=True, ondelete="CASCADE")
+    offset_days: int = Field(primary_key=True)
+    due_date: date_ = Field(index=True)
+
+
+# Slack messages waiting to be sent. Written in the same transaction as the
+# change they announce and sent by the outbox worker (scholark.outbox).
+class OutboxMessage(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    channel: str
+    text: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC), sa_type=sa.DateTime(timezone=True))  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
+    attempts: int = 0
+    # None once the worker has given up on the message.
+    next_attempt_at: datetime | None = Field(  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
+        default_factory=lambda: datetime.now(UTC),
+        sa_type=sa.DateTime(timezone=True),
+        index=True,
+    )
+
+
 class TagBase(SQLModel):
     name: str
     color: str
@@ -43,7 +101,7 @@ class TagUpdate(SQLModel):
 
 class Tag(TagBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
+    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE", index=True)
 
     user: "User" = Relationship(back_populates="tags")
     conferences: list["Conference"] = Relationship(back_populates="tags", link_model=TagConferenceLink)
@@ -72,7 +130,7 @@ class TagsPublic(SQLModel):
 
 class ConferenceMilestoneBase(SQLModel):
     name: str
-    date: date_
+    date: date_ = Field(index=True)
     time: time_ | None = Field(default=None, sa_type=sa.Time(timezone=True))  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
 
     @computed_field
@@ -103,7 +161,7 @@ class ConferenceMilestoneUpdate(ConferenceMilestoneBase):
 
 class ConferenceMilestone(ConferenceMilestoneBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    conference_id: uuid.UUID = Field(foreign_key="conference.id", ondelete="CASCADE")
+    conference_id: uuid.UUID = Field(foreign_key="conference.id", ondelete="CASCADE", index=True)
 
     conference: "Conference" = Relationship(back_populates="milestones")
 
@@ -115,7 +173,7 @@ class ConferenceMilestonePublic(ConferenceMilestoneBase):
 
 class ConferenceBase(SQLModel):
     name: str
-    start_date: date_ | None = Field(default=None)
+    start_date: date_ | None = Field(default=None, index=True)
     end_date: date_ | None = Field(default=None)
     location: str | None = Field(default=None)
     website_url: str | None = Field(default=None)
@@ -132,10 +190,30 @@ class ConferenceUpdate(ConferenceBase):
 
 
 class Conference(ConferenceBase, table=True):
+    # Trigram indexes serve the case-insensitive substring filters on the
+    # conference list (ILIKE '%...%' cannot use a B-tree index).
+    __table_args__ = (
+        sa.Index("ix_conference_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        sa.Index(
+            "ix_conference_location_trgm",
+            "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC), sa_type=sa.DateTime(timezone=True))  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC), sa_type=sa.DateTime(timezone=True))  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
-    created_by_user_id: uuid.UUID | None = Field(foreign_key="user.id", ondelete="SET NULL")
+    # Indexed for the changes feed, which pages through rows by updated_at.
+    updated_at: datetime = Field(  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
+        default_factory=lambda: datetime.now(UTC),
+        sa_type=sa.DateTime(timezone=True),
+        index=True,
+    )
+    created_by_user_id: uuid.UUID | None = Field(foreign_key="user.id", ondelete="SET NULL", index=True)
+    # Soft-delete tombstone: deleted conferences keep their row (with
+    # updated_at bumped) so the changes feed can report the deletion.
+    deleted_at: datetime | None = Field(default=None, sa_type=sa.DateTime(timezone=True))  # type: ignore[call-overload] # ty: ignore[invalid-argument-type]
 
     tags: list[Tag] = Relationship(back_populates="conferences", link_model=TagConferenceLink)
     milestones: list[ConferenceMilestone] = Relationship(back_populates="conference", cascade_delete=True)
@@ -155,7 +233,21 @@ class ConferencePublic(ConferenceBase):
 
 class ConferencesPublic(SQLModel):
     data: list[ConferencePublic]
-    count: int
+    # None when the client opted out of counting (with_count=false).
+    count: int | None
+    # Opaque keyset cursor for the next page; None on the last page.
+    next_cursor: str | None = None
+
+
+class ConferenceChanges(SQLModel):
+    # Conferences created or updated since the token.
+    data: list[ConferencePublic]
+    # Ids of conferences deleted since the token.
+    deleted: list[uuid.UUID]
+    # Token to pass as since on the next call.
+    next_token: str
+    # Whether more changes are waiting; if so, call again right away.
+    has_more: bool
 
 
 class UserBase(SQLModel):
@@ -169,6 +261,7 @@ class UserCreate(UserBase):
 
 class UserUpdateMe(SQLModel):
     slack_user_id: str | None = Field(default=None)
+    timezone: Timezone | None = Field(default=None)
 
 
 class UserRegister(SQLModel):
@@ -183,6 +276,8 @@ class User(UserBase, table=True):
     disabled: bool = Field(default=False)
     role: str = Field(default="member")
     slack_user_id: str | None = Field(default=None)
+    # Timezone of the user's milestone reminders; None means REMINDER_TIMEZONE.
+    timezone: str | None = Field(default=None)
 
     tags: list[Tag] = Relationship(back_populates="user", cascade_delete=True)
     subscribed_conferences: list["Conference"] = Relationship(
@@ -196,6 +291,7 @@ class UserPublic(UserBase):
     created_at: datetime
     updated_at: datetime
     slack_user_id: str | None = None
+    timezone: str | None = None
 
 
 class UsersPublic(SQLModel):
@@ -0,0 +1,109 @@
+"""Transactional outbox for Slack channel notifications.
+
+API workers never call Slack: enqueue() adds the message to the session, so
+it is committed together with the change it announces, or not at all. The
+outbox worker (scholark.cli.drain_outbox) claims due messages in batches,
+sends them and deletes them once Slack has accepted them. Failed messages
+are retried with exponential backoff until OUTBOX_MAX_ATTEMPTS, so delivery
+is at least once: messages a worker has sent but not yet deleted when it
+dies are sent again once their lease expires.
+"""
+
+import functools
+import logging
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from slack_sdk import WebClient
+from sqlmodel import Session, col, delete, select, update
+
+from scholark.core.config import settings
+from scholark.models import OutboxMessage
+from scholark.slack import SlackDispatcher
+
+logger = logging.getLogger(__name__)
+
+# Messages claimed at a time. Small, as a channel takes about one message per
+# second (SLACK_CHANNEL_INTERVAL) and sent messages are only deleted once the
+# whole batch is done.
+OUTBOX_BATCH_SIZE = 10
+# How long claimed messages are withheld from other workers; if the worker
+# dies meanwhile, they become due again once it expires.
+OUTBOX_LEASE = timedelta(minutes=5)
+# Attempts (each with the dispatcher's own retries) before a message is given up.
+OUTBOX_MAX_ATTEMPTS = 10
+OUTBOX_RETRY_BASE = timedelta(seconds=30)
+OUTBOX_RETRY_MAX = timedelta(hours=1)
+
+
+def enqueue(session: Session, text: str) -> None:
+    """Queue a message for the configured Slack channel; no-op if none is configured."""
+    if not settings.SLACK_CHANNEL_ID:
+        return
+    session.add(OutboxMessage(channel=settings.SLACK_CHANNEL_ID, text=text))
+
+
+def drain(session: Session, client: WebClient, *, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """Send one batch of due messages; return how many were claimed.
+
+    The batch is claimed by leasing it, moving its next_attempt_at
+    OUTBOX_LEASE ahead, in a short transaction of its own: no row stays
+    locked while Slack is called, and other workers skip the leased rows, so
+    several workers can drain the outbox at once. A second short
+    transaction then deletes the sent messages and reschedules the rest.
+    """
+    now = datetime.now(UTC)
+    statement = (
+        select(OutboxMessage)
+        .where(col(OutboxMessage.next_attempt_at) <= now)
+        .order_by(col(OutboxMessage.next_attempt_at))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    messages = session.exec(statement).all()
+    if not messages:
+        session.rollback()
+        return 0
+    claimed = [(message.id, message.channel, message.text, message.attempts) for message in messages]
+    for message in messages:
+        message.next_attempt_at = now + OUTBOX_LEASE
+    session.commit()
+
+    sent = set[uuid.UUID]()
+    with SlackDispatcher(client) as dispatcher:
+        for message_id, channel, text, _ in claimed:
+            dispatcher.submit(
+                channel,
+                text,
+                description=f"outbox message {message_id}",
+                on_sent=functools.partial(sent.add, message_id),
+            )
+
+    now = datetime.now(UTC)
+    failed = []
+    for message_id, _, _, previous_attempts in claimed:
+        if message_id in sent:
+            continue
+        attempts = previous_attempts + 1
+        if attempts >= OUTBOX_MAX_ATTEMPTS:
+            logger.error(f"Giving up on outbox message {message_id} after {attempts} attempts")
+            next_attempt_at = None
+        else:
+            next_attempt_at = now + min(OUTBOX_RETRY_MAX, OUTBOX_RETRY_BASE * 2 ** (attempts - 1))
+        failed.append({"id": message_id, "attempts": attempts, "next_attempt_at": next_attempt_at})
+    if sent:
+        session.execute(delete(OutboxMessage).where(col(OutboxMessage.id).in_(sent)))
+    if failed:
+        session.execute(update(OutboxMessage), failed)
+    session.commit()
+    return len(claimed)
+
+
+def drain_all(session: Session, client: WebClient) -> int:
+    """Send batches until no message is due; return how many were claimed."""
+    total = 0
+    while (claimed := drain(session, client)) > 0:
+        total += claimed
+        if claimed < OUTBOX_BATCH_SIZE:
+            break
+    return total
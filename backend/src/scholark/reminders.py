@@ -0,0 +1,82 @@
+"""Precomputed schedule of milestone reminders.
+
+ReminderDue holds a row per milestone and configured offset, dated the day
+the reminder is due, so the reminder job finds a day's reminders through
+the due_date index instead of comparing every milestone's date. Conference
+writes keep the rows in step with the milestones; rebuild_schedule()
+recomputes them all, e.g. after REMINDER_OFFSETS_DAYS changes. Moving a
+milestone's date also forgets its delivered reminders, so a deadline
+extension brings its reminders round again.
+"""
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlmodel import Session, col, delete, insert, select
+
+from scholark.core.config import settings
+from scholark.models import Conference, ConferenceMilestone, ReminderDelivery, ReminderDue
+
+# Milestones read per round trip while rebuilding the schedule.
+REBUILD_BATCH_SIZE = 1000
+
+
+def _due_rows(milestone_id: UUID, milestone_date: date) -> list[dict[str, Any]]:
+    return [
+        {"milestone_id": milestone_id, "offset_days": days, "due_date": milestone_date - timedelta(days=days)}
+        for days in set(settings.REMINDER_OFFSETS_DAYS)
+    ]
+
+
+def schedule(session: Session, milestones: Iterable[ConferenceMilestone]) -> None:
+    """Schedule the reminders of newly created milestones."""
+    session.add_all(
+        ReminderDue.model_validate(row) for milestone in milestones for row in _due_rows(milestone.id, milestone.date)
+    )
+
+
+def unschedule(session: Session, conference_id: UUID) -> None:
+    """Drop the scheduled reminders of the conference's milestones."""
+    milestone_ids = select(ConferenceMilestone.id).where(ConferenceMilestone.conference_id == conference_id)
+    session.execute(delete(ReminderDue).where(col(ReminderDue.milestone_id).in_(milestone_ids)))
+
+
+def reschedule(session: Session, conference: Conference) -> None:
+    """Replace the scheduled reminders of the conference's milestones after they changed."""
+    dates = {milestone.id: milestone.date for milestone in conference.milestones}
+    scheduled = session.exec(
+        select(col(ReminderDue.milestone_id), col(ReminderDue.offset_days), col(ReminderDue.due_date)).where(
+            col(ReminderDue.milestone_id).in_(dates),
+        ),
+    ).all()
+    moved = {
+        milestone_id
+        for milestone_id, offset_days, due_date in scheduled
+        if due_date + timedelta(days=offset_days) != dates[milestone_id]
+    }
+    if moved:
+        session.execute(delete(ReminderDelivery).where(col(ReminderDelivery.milestone_id).in_(moved)))
+    unschedule(session, conference.id)
+    schedule(session, conference.milestones)
+
+
+def rebuild_schedule(session: Session) -> int:
+    """Recompute the reminders of every live milestone; return the number scheduled.
+
+    Runs in the caller's transaction, so the job never sees a partial schedule.
+    """
+    session.execute(delete(ReminderDue))
+    statement = (
+        select(col(ConferenceMilestone.id), col(ConferenceMilestone.date))
+        .join(Conference, col(Conference.id) == ConferenceMilestone.conference_id)
+        .where(col(Conference.deleted_at).is_(None))
+        .execution_options(yield_per=REBUILD_BATCH_SIZE)
+    )
+    count = 0
+    for milestones in session.exec(statement).partitions():
+        rows = [row for milestone_id, milestone_date in milestones for row in _due_rows(milestone_id, milestone_date)]
+        session.execute(insert(ReminderDue), rows)
+        count += len(rows)
+    return count
@@ -0,0 +1,101 @@
+"""In-process scheduler for the background jobs.
+
+A long-running process keeps the engine's connection pool and the Slack
+client warm between runs, instead of paying the interpreter, import and
+connection start-up of a cron-spawned process every time. Each job runs on
+its own thread at its interval; a PostgreSQL advisory lock keyed by the job
+name makes sure that, across replicas, only one process runs a job at a time.
+"""
+
+import logging
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import Engine, func, select
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Job:
+    name: str
+    interval: timedelta
+    run: Callable[[Session], object]
+
+    @property
+    def lock_key(self) -> int:
+        # Stable across processes and releases, unlike hash().
+        return zlib.crc32(f"scholark.scheduler:{self.name}".encode())
+
+
+@contextmanager
+def advisory_lock(engine: Engine, key: int) -> Iterator[bool]:
+    """Hold the advisory lock for the block; yield whether it was free.
+
+    The lock belongs to a dedicated connection, so it is released when the
+    block ends or, should the process die, when the connection drops.
+    Databases without advisory locks always yield True.
+    """
+    if engine.dialect.name != "postgresql":
+        yield True
+        return
+    # Autocommit, so the connection does not sit idle in a transaction for the
+    # whole run, where idle_in_transaction_session_timeout would end it.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        acquired = bool(connection.scalar(select(func.pg_try_advisory_lock(key))))
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.scalar(select(func.pg_advisory_unlock(key)))
+
+
+class Scheduler:
+    """Run each job at its interval on a thread of its own until stopped."""
+
+    def __init__(self, engine: Engine, jobs: list[Job]) -> None:
+        self._engine = engine
+        self._jobs = jobs
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._loop, args=(job,), name=f"scheduler-{job.name}", daemon=True) for job in jobs
+        ]
+
+    def run_job(self, job: Job) -> bool:
+        """Run the job once unless another process is running it; return whether it ran."""
+        with advisory_lock(self._engine, job.lock_key) as acquired:
+            if not acquired:
+                logger.info(f"Skipping job {job.name}: running elsewhere")
+                return False
+            start = time.perf_counter()
+            with Session(self._engine) as session:
+                job.run(session)
+            logger.info(f"Job {job.name} finished in {time.perf_counter() - start:.1f}s")
+            return True
+
+    def start(self) -> None:
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def join(self) -> None:
+        """Wait for the jobs' threads, which finish their current run after stop()."""
+        for thread in self._threads:
+            thread.join()
+
+    def _loop(self, job: Job) -> None:
+        while not self._stop.is_set():
+            start = time.monotonic()
+            try:
+                self.run_job(job)
+            except Exception:
+                logger.exception(f"Job {job.name} failed")
+            self._stop.wait(max(0.0, job.interval.total_seconds() - (time.monotonic() - start)))
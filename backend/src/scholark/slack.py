@@ -1,21 +1,329 @@
+import functools
+import io
+import itertools
 import logging
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from http import HTTPStatus
+from http.client import HTTPConnection, HTTPSConnection, RemoteDisconnected
+from typing import Any, Self
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit, urlunsplit
+from urllib.request import Request
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import sqlalchemy as sa
 from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry import ConnectionErrorRetryHandler
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, col, select
 
 from scholark.core.config import settings
-from scholark.models import Conference, ConferenceMilestone, ConferenceSubscription, User
+from scholark.models import (
+    Conference,
+    ConferenceMilestone,
+    ConferenceSubscription,
+    ReminderDelivery,
+    ReminderDue,
+    User,
+)
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip while streaming reminder recipients.
+REMINDER_BATCH_SIZE = 500
+# Slack allows about one message per second to the same channel.
+SLACK_CHANNEL_INTERVAL = 1.0
+# Seconds to wait for Slack to accept a connection or answer a request.
+SLACK_TIMEOUT = 10
+
 
 def _get_slack_client() -> WebClient | None:
-    """Return a Slack WebClient if configured, else None."""
+    """Return the shared Slack WebClient if configured, else None."""
     if not settings.SLACK_BOT_TOKEN:
         return None
-    return WebClient(token=settings.SLACK_BOT_TOKEN)
+    return _shared_client(settings.SLACK_BOT_TOKEN)
+
+
+@functools.cache
+def _shared_client(token: str) -> WebClient:
+    # Created on first use and shared by every thread of the process, so
+    # connections are reused across messages and job runs.
+    return PooledWebClient(token=token, timeout=SLACK_TIMEOUT)
+
+
+class ConnectionPool:
+    """Idle HTTP connections by (scheme, host), shared by the process's threads.
+
+    A thread checks a connection out for one request and back in once it has
+    read the response, so connections outlive the thread pools of individual
+    dispatchers. At most max_idle connections are kept per host.
+    """
+
+    def __init__(self, max_idle: int) -> None:
+        self._max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str], list[HTTPConnection]] = defaultdict(list)
+
+    def check_out(self, key: tuple[str, str]) -> HTTPConnection | None:
+        """Take an idle connection to the host, or None if there is none."""
+        with self._lock:
+            idle = self._idle[key]
+            return idle.pop() if idle else None
+
+    def check_in(self, key: tuple[str, str], connection: HTTPConnection) -> None:
+        """Return a connection after a complete request, closing it if enough are idle."""
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self._max_idle:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def discard(self, key: tuple[str, str] | None = None) -> None:
+        """Close the idle connections to the host, or to every host."""
+        with self._lock:
+            keys = list(self._idle) if key is None else [key]
+            connections = [connection for host in keys for connection in self._idle.pop(host, [])]
+        for connection in connections:
+            connection.close()
+
+
+connection_pool = ConnectionPool(max_idle=settings.SLACK_MAX_CONCURRENCY)
+
+
+class PooledWebClient(WebClient):
+    """WebClient that keeps its HTTP connections open between API calls.
+
+    The stock client sends each call through urllib, which opens a new
+    connection, with a new TLS handshake, every time. This one sends it over
+    a persistent connection from connection_pool, shared by every client and
+    thread of the process; a connection that fails is dropped, and the retry
+    handlers retry the call on a new one. Everything else, including error
+    handling, is WebClient's own.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        # Only connection errors are retried by default, notably on a pooled
+        # connection the server closed while idle. Rate limits and server
+        # errors are left to SlackDispatcher, which holds back all its threads
+        # after a 429.
+        error_types: list[type[Exception]] = [URLError, ConnectionResetError, RemoteDisconnected, BrokenPipeError]
+        kwargs.setdefault("retry_handlers", [ConnectionErrorRetryHandler(error_types=error_types)])
+        super().__init__(**kwargs)
+
+    def _perform_urllib_http_request_internal(self, url: str, req: Request) -> dict[str, Any]:
+        parts = urlsplit(url)
+        if self.proxy is not None or parts.scheme not in {"http", "https"}:
+            return super()._perform_urllib_http_request_internal(url, req)
+
+        key = (parts.scheme, parts.netloc)
+        connection = connection_pool.check_out(key)
+        if connection is None:
+            if parts.scheme == "https":
+                connection = HTTPSConnection(parts.netloc, timeout=self.timeout, context=self.ssl)
+            else:
+                connection = HTTPConnection(parts.netloc, timeout=self.timeout)
+        path = urlunsplit(("", "", parts.path, parts.query, ""))
+        try:
+            connection.request("POST", path, body=req.data, headers=dict(req.header_items()))
+            response = connection.getresponse()
+            body = response.read()
+        except Exception:
+            connection.close()
+            # The server probably closed the other idle connections too.
+            connection_pool.discard(key)
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            connection_pool.check_in(key, connection)
+
+        # Raised like urllib does, for WebClient to handle.
+        if not HTTPStatus.OK <= response.status < HTTPStatus.MULTIPLE_CHOICES:
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+        if response.headers.get_content_type() == "application/gzip":
+            return {"status": response.status, "headers": response.headers, "body": body}
+        charset = response.headers.get_content_charset() or "utf-8"
+        return {"status": response.status, "headers": response.headers, "body": body.decode(charset)}
+
+
+class _RateLimiter:
+    """Space out request starts, overall and per channel, across threads."""
+
+    def __init__(self, messages_per_second: float, channel_interval: float) -> None:
+        self._interval = 1 / messages_per_second
+        self._channel_interval = channel_interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+        self._next_start_by_channel: dict[str, float] = {}
+
+    def acquire(self, channel: str) -> None:
+        """Block until a request to the channel may start."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start, self._next_start_by_channel.get(channel, 0.0))
+            self._next_start = start + self._interval
+            self._next_start_by_channel[channel] = start + self._channel_interval
+        time.sleep(start - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the given time, as Slack asks after a 429."""
+        with self._lock:
+            self._next_start = max(self._next_start, time.monotonic() + seconds)
+
+
+class SlackDispatcher:
+    """Send Slack messages from a bounded thread pool within Slack's rate limits.
+
+    Message starts are spaced by SLACK_MESSAGES_PER_SECOND overall and by
+    SLACK_CHANNEL_INTERVAL per channel. A 429 pauses every thread for the
+    Retry-After period; server and connection errors are retried with
+    exponential backoff, up to SLACK_MAX_RETRIES times. Other errors are
+    logged and not retried. Leaving the context waits for every submitted
+    message; sent and failed count the outcomes (rate_limited the 429s),
+    and a message's on_sent callback runs on the sending thread once Slack
+    has accepted it.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        client: WebClient,
+        *,
+        max_workers: int | None = None,
+        messages_per_second: float | None = None,
+        max_retries: int | None = None,
+        channel_interval: float | None = None,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ) -> None:
+        max_workers = max_workers or settings.SLACK_MAX_CONCURRENCY
+        self._client = client
+        self._limiter = _RateLimiter(
+            messages_per_second or settings.SLACK_MESSAGES_PER_SECOND,
+            SLACK_CHANNEL_INTERVAL if channel_interval is None else channel_interval,
+        )
+        self._max_retries = settings.SLACK_MAX_RETRIES if max_retries is None else max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="slack-dispatcher")
+        # Bounds the queued messages, so a caller streaming rows from the
+        # database cannot run arbitrarily far ahead of the senders.
+        self._queue_slots = threading.Semaphore(max_workers * 2)
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+        self.rate_limited = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def submit(
+        self,
+        channel: str,
+        text: str,
+        description: str,
+        on_sent: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue a message; description names it in the log."""
+        self._queue_slots.acquire()
+        future = self._executor.submit(self._send, channel, text, description, on_sent)
+        future.add_done_callback(lambda _: self._queue_slots.release())
+
+    def _send(self, channel: str, text: str, description: str, on_sent: Callable[[], None] | None) -> None:
+        try:
+            sent = self._send_with_retries(channel, text, description)
+        except Exception:
+            logger.exception(f"Failed to send {description}")
+            sent = False
+        with self._lock:
+            if sent:
+                self.sent += 1
+            else:
+                self.failed += 1
+        if sent and on_sent is not None:
+            on_sent()
+
+    def _send_with_retries(self, channel: str, text: str, description: str) -> bool:
+        for attempt in itertools.count():
+            self._limiter.acquire(channel)
+            try:
+                self._client.chat_postMessage(channel=channel, text=text)
+            except SlackApiError as exc:
+                status = exc.response.status_code
+                if status == HTTPStatus.TOO_MANY_REQUESTS:
+                    with self._lock:
+                        self.rate_limited += 1
+                    # The limiter holds every thread back, this retry included.
+                    retry_after = _retry_after(exc.response.headers)
+                    self._limiter.pause(retry_after)
+                    delay, wait = retry_after, 0.0
+                elif status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                    delay = wait = self._backoff(attempt)
+                else:
+                    logger.exception(f"Failed to send {description}")
+                    return False
+                error = f"HTTP {status}"
+            except OSError as exc:
+                delay = wait = self._backoff(attempt)
+                error = str(exc)
+            else:
+                logger.info(f"Sent {description}")
+                return True
+
+            if attempt >= self._max_retries:
+                logger.error(f"Failed to send {description} after {attempt + 1} attempts: {error}")
+                return False
+            logger.warning(f"Retrying {description} in {delay:.1f}s: {error}")
+            time.sleep(wait)
+        raise AssertionError  # pragma: no cover
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter spreads the retries of concurrent senders.
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * 2**attempt))  # noqa: S311
+
+
+class _DryRunDispatcher:
+    """Stand-in for SlackDispatcher that drops every message unsent."""
+
+    sent = failed = rate_limited = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        pass
+
+    def submit(
+        self,
+        channel: str,
+        text: str,
+        description: str,
+        on_sent: Callable[[], None] | None = None,  # noqa: ARG002 (nothing is ever sent)
+    ) -> None:
+        logger.debug(f"Dry run, not sending {description} to {channel}: {text!r}")
+
+
+def _retry_after(headers: Mapping[str, Any]) -> float:
+    value = headers.get("Retry-After", headers.get("retry-after"))
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return 1.0
 
 
 def build_new_conference_message(conference: Conference) -> str | None:
@@ -54,76 +362,238 @@ def build_new_conference_message(conference: Conference) -> str | None:
     return "\n".join(lines)
 
 
-def send_channel_message(text: str) -> None:
-    """Post a message to the configured Slack channel.
+def _reminder_line(milestone_name: str, conference_name: str, days: int, milestone_date: date) -> str:
+    return f"*{milestone_name}* for *{conference_name}* is in {days} days ({milestone_date})"
+
+
+class _DeliveryLog:
+    """Record delivered reminders in ReminderDelivery, a batch at a time.
 
-    No-op if Slack is not configured. Errors are logged but never raised, so
-    this is safe to run as a background task.
+    Dispatcher threads add a reminder once Slack has accepted it; the job's
+    thread writes the batches. The reminder query is still streaming on the
+    job's session, so batches are committed on a session of their own. A
+    crash loses at most the unwritten batch, whose reminders the next run
+    sends again.
     """
-    client = _get_slack_client()
-    if client is None or not settings.SLACK_CHANNEL_ID:
-        return
 
-    try:
-        client.chat_postMessage(channel=settings.SLACK_CHANNEL_ID, text=text)
-        logger.info("Slack channel notification sent")
-    except Exception:
-        logger.exception("Failed to send Slack channel notification")
+    def __init__(self, session: Session, batch_size: int) -> None:
+        self._session = Session(session.get_bind())
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: list[dict[str, Any]] = []
 
+    def __enter__(self) -> Self:
+        return self
 
-def send_milestone_reminders(session: Session) -> None:
-    """Send DM reminders for milestones that are 30 or 7 days away.
+    def __exit__(self, *_exc_info: object) -> None:
+        # Whatever was delivered is recorded, even if the job failed midway.
+        try:
+            self.flush()
+        finally:
+            self._session.close()
 
-    Queries all milestones matching the target dates, finds subscribed users
-    with a slack_user_id, and sends each a DM.
-    """
-    client = _get_slack_client()
-    if client is None:
-        logger.info("Slack not configured, skipping milestone reminders")
-        return
+    def add(self, user_id: UUID, milestones: list[tuple[UUID, int]]) -> None:
+        delivered_at = datetime.now(UTC)
+        with self._lock:
+            self._pending.extend(
+                {"user_id": user_id, "milestone_id": milestone_id, "offset_days": days, "delivered_at": delivered_at}
+                for milestone_id, days in milestones
+            )
 
-    # "Today" in the configured reminder timezone; computing it in UTC would
-    # deliver the 7/30-day reminders a day early for users west of UTC.
-    today = datetime.now(tz=ZoneInfo(settings.REMINDER_TIMEZONE)).date()
-    target_dates = {
-        today + timedelta(days=30): 30,
-        today + timedelta(days=7): 7,
-    }
+    def flush_if_full(self) -> None:
+        if len(self._pending) >= self._batch_size:
+            self.flush()
 
-    statement = select(ConferenceMilestone).where(col(ConferenceMilestone.date).in_(target_dates.keys()))
-    milestones = session.exec(statement).all()
+    def flush(self) -> None:
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+        # A concurrent run may have recorded the same reminder meanwhile.
+        insert = postgresql.insert if self._session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        self._session.execute(insert(ReminderDelivery).on_conflict_do_nothing(), rows)
+        self._session.commit()
 
-    if not milestones:
-        logger.info("No milestones matching reminder dates")
-        return
 
-    scholark_url = settings.FRONTEND_HOST.rstrip("/")
+@dataclass
+class ReminderRunMetrics:
+    """What a reminder run did and where its time went."""
 
-    for milestone in milestones:
-        days = target_dates[milestone.date]
-        conference = milestone.conference
-
-        # Find subscribed users with slack_user_id
-        sub_statement = (
-            select(User)
-            .join(ConferenceSubscription, ConferenceSubscription.user_id == User.id)  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
-            .where(
-                ConferenceSubscription.conference_id == conference.id,
-                User.slack_user_id.is_not(None),  # type: ignore[union-attr] # ty: ignore[unresolved-attribute]
-            )
+    dry_run: bool = False
+    # Time spent waiting for the database, including streaming the rows.
+    query_seconds: float = 0.0
+    messages_built: int = 0
+    messages_sent: int = 0
+    messages_failed: int = 0
+    # Responses with HTTP 429, each retried after Retry-After.
+    rate_limited: int = 0
+    wall_seconds: float = 0.0
+
+
+def _timed[T](rows: Iterable[T], metrics: ReminderRunMetrics) -> Iterator[T]:
+    """Yield the rows, adding the time spent fetching them to the query time."""
+    iterator = iter(rows)
+    while True:
+        start = time.perf_counter()
+        row = next(iterator, None)
+        metrics.query_seconds += time.perf_counter() - start
+        if row is None:
+            return
+        yield row
+
+
+def _due_timezone_groups(session: Session, now: datetime, evaluated: Mapping[str, date]) -> dict[date, set[str]]:
+    """Group the timezones of users with a Slack id by their current local date.
+
+    Timezones already evaluated for their current local date are left out.
+    """
+    names = session.exec(
+        select(col(User.timezone)).where(col(User.slack_user_id).is_not(None)).distinct(),
+    ).all()
+    groups: dict[date, set[str]] = defaultdict(set)
+    for name in {name or settings.REMINDER_TIMEZONE for name in names}:
+        try:
+            today = now.astimezone(ZoneInfo(name)).date()
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(f"Skipping reminders for users in unknown timezone {name!r}")
+            continue
+        if evaluated.get(name) != today:
+            groups[today].add(name)
+    return groups
+
+
+def _due_reminders_statement(today: date, timezones: set[str]) -> sa.Select[*tuple[Any, ...]]:
+    """Select the undelivered reminders due today for subscribers in the given timezones.
+
+    One joined query for every (milestone, conference, subscriber) triple,
+    starting from today's rows of the reminder schedule and streamed in
+    batches as plain columns so memory stays bounded however many
+    subscribers a day's deadlines have. Rows come grouped by user, so a
+    digest only ever holds one user's milestones.
+    """
+    in_timezones: sa.ColumnElement[bool] = col(User.timezone).in_(timezones)
+    if settings.REMINDER_TIMEZONE in timezones:
+        in_timezones = in_timezones | col(User.timezone).is_(None)
+    delivered = sa.exists().where(
+        col(ReminderDelivery.user_id) == User.id,
+        col(ReminderDelivery.milestone_id) == ReminderDue.milestone_id,
+        col(ReminderDelivery.offset_days) == ReminderDue.offset_days,
+    )
+    return (
+        sa.select(
+            col(User.id),
+            col(User.username),
+            col(User.slack_user_id),
+            col(ConferenceMilestone.id),
+            col(ConferenceMilestone.name),
+            col(ConferenceMilestone.date),
+            col(ReminderDue.offset_days),
+            col(Conference.name),
         )
-        users = session.exec(sub_statement).all()
+        .select_from(ReminderDue)
+        .join(ConferenceMilestone, col(ConferenceMilestone.id) == ReminderDue.milestone_id)
+        .join(Conference, col(Conference.id) == ConferenceMilestone.conference_id)
+        .join(ConferenceSubscription, col(ConferenceSubscription.conference_id) == Conference.id)
+        .join(User, col(User.id) == ConferenceSubscription.user_id)
+        .where(
+            col(ReminderDue.due_date) == today,
+            # Offsets dropped from the settings stop before the schedule is rebuilt.
+            col(ReminderDue.offset_days).in_(settings.REMINDER_OFFSETS_DAYS),
+            col(Conference.deleted_at).is_(None),
+            col(User.slack_user_id).is_not(None),
+            in_timezones,
+            ~delivered,
+        )
+        .order_by(col(User.id), col(ConferenceMilestone.date), col(ConferenceMilestone.id))
+        .execution_options(yield_per=REMINDER_BATCH_SIZE)
+    )
 
-        for user in users:
-            if not user.slack_user_id:
-                continue
-            try:
-                text = (
-                    f":alarm_clock: Reminder: *{milestone.name}* for *{conference.name}* "
-                    f"is in {days} days ({milestone.date})\n"
-                    f":link: <{scholark_url}/conferences|View in Scholark>"
+
+def send_milestone_reminders(
+    session: Session,
+    *,
+    evaluated: dict[str, date] | None = None,
+    dry_run: bool = False,
+) -> ReminderRunMetrics:
+    """Send DM reminders for milestones due today per REMINDER_OFFSETS_DAYS.
+
+    "Today" is the user's local date, in their timezone or else in
+    REMINDER_TIMEZONE. Users are bucketed by local date, and each bucket's
+    reminders (see scholark.reminders) are streamed in a single query.
+    evaluated, kept across runs by the scheduler, maps timezones to the
+    local date they were last evaluated for: those already evaluated for
+    their current date are skipped, and a run that completes records the
+    dates it evaluated, even if some messages failed (after the
+    dispatcher's retries), so a recipient Slack keeps refusing does not
+    bring the bucket back every run. A timezone is thus evaluated once per
+    local day, however late in the day the scheduler first runs or resumes.
+    Each user gets a DM per milestone, or, with REMINDER_DIGEST, a single
+    DM listing all of them.
+    Delivered reminders are logged and skipped by later runs, so the job
+    can be rerun, or resumed after a crash, without sending duplicates.
+
+    A dry run builds every message but neither sends nor logs any, and
+    does not need Slack to be configured.
+    """
+    started = time.perf_counter()
+    metrics = ReminderRunMetrics(dry_run=dry_run)
+    client = _get_slack_client()
+    if client is None and not dry_run:
+        logger.info("Slack not configured, skipping milestone reminders")
+        return metrics
+
+    start = time.perf_counter()
+    groups = _due_timezone_groups(session, datetime.now(UTC), evaluated or {})
+    metrics.query_seconds += time.perf_counter() - start
+
+    link = f":link: <{settings.FRONTEND_HOST.rstrip('/')}/conferences|View in Scholark>"
+    dispatcher = _DryRunDispatcher() if client is None or dry_run else SlackDispatcher(client)
+    with _DeliveryLog(session, REMINDER_BATCH_SIZE) as log, dispatcher:
+        rows = _timed(
+            itertools.chain.from_iterable(
+                session.execute(_due_reminders_statement(today, timezones)) for today, timezones in groups.items()
+            ),
+            metrics,
+        )
+        for (user_id, username, slack_user_id), user_rows in itertools.groupby(rows, key=lambda row: tuple(row[:3])):
+            milestones = [
+                (milestone_id, (milestone_name, conference_name, days, milestone_date))
+                for *_, milestone_id, milestone_name, milestone_date, days, conference_name in user_rows
+            ]
+            if settings.REMINDER_DIGEST:
+                lines = [f"• {_reminder_line(*milestone)}" for _, milestone in milestones]
+                dispatcher.submit(
+                    slack_user_id,
+                    "\n".join([":alarm_clock: Upcoming milestones:", *lines, link]),
+                    description=f"reminder digest of {len(milestones)} milestones to {username}",
+                    on_sent=functools.partial(
+                        log.add,
+                        user_id,
+                        [(milestone_id, milestone[2]) for milestone_id, milestone in milestones],
+                    ),
                 )
-                client.chat_postMessage(channel=user.slack_user_id, text=text)
-                logger.info(f"Sent reminder to {user.username} for {milestone.name} ({conference.name})")
-            except Exception:
-                logger.exception(f"Failed to send reminder to {user.username} for {milestone.name}")
+                metrics.messages_built += 1
+            else:
+                for milestone_id, milestone in milestones:
+                    dispatcher.submit(
+                        slack_user_id,
+                        f":alarm_clock: Reminder: {_reminder_line(*milestone)}\n{link}",
+                        description=f"reminder to {username} for {milestone[0]} ({milestone[1]})",
+                        on_sent=functools.partial(log.add, user_id, [(milestone_id, milestone[2])]),
+                    )
+                metrics.messages_built += len(milestones)
+            log.flush_if_full()
+
+    metrics.messages_sent = dispatcher.sent
+    metrics.messages_failed = dispatcher.failed
+    metrics.rate_limited = dispatcher.rate_limited
+    metrics.wall_seconds = time.perf_counter() - started
+    if evaluated is not None and not dry_run:
+        evaluated.update((name, today) for today, timezones in groups.items() for name in timezones)
+    if dry_run:
+        logger.info(f"Dry run: built {metrics.messages_built} reminders, sent none")
+    elif not metrics.messages_built:
+        logger.info("No reminders due for the reminder dates")
+    else:
+        logger.info(f"Sent {metrics.messages_sent} reminders, {metrics.messages_failed} failed")
+    return metrics
@@ -1,10 +1,14 @@
 import uuid
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
-from scholark.models import TagConferenceLink, User
+from scholark.core.cache import conference_cache
+from scholark.core.config import settings
+from scholark.models import Conference, ReminderDue, TagConferenceLink, User
 from tests.conftest import HeadersFor
 
 API = "/api/v1"
@@ -15,6 +19,7 @@ def create_conference(
     headers: dict[str, str],
     *,
     name: str = "Test Conference",
+    start_date: str | None = "2027-06-01",
     milestones: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     response = client.post(
@@ -22,7 +27,7 @@ def create_conference(
         headers=headers,
         json={
             "name": name,
-            "start_date": "2027-06-01",
+            "start_date": start_date,
             "end_date": "2027-06-05",
             "location": "Tokyo",
             "website_url": "https://example.com",
@@ -170,6 +175,28 @@ def test_write_endpoints_do_not_leak_other_users_tags(
     assert [tag["id"] for tag in response.json()["tags"]] == [my_tag["id"]]
 
 
+def test_is_subscribed_is_computed_per_user(
+    client: TestClient,
+    user: User,
+    other_user: User,
+    headers_for: HeadersFor,
+) -> None:
+    conference = create_conference(client, headers_for(user))
+    assert conference["is_subscribed"] is True
+
+    for url in (f"{API}/conferences/", f"{API}/conferences/{conference['id']}"):
+        response = client.get(url, headers=headers_for(other_user))
+        assert response.status_code == 200, response.text
+        body = response.json()
+        data = body["data"][0] if "data" in body else body
+        assert data["is_subscribed"] is False
+
+    response = client.post(f"{API}/conferences/{conference['id']}/subscribe", headers=headers_for(other_user))
+    assert response.status_code == 200, response.text
+    response = client.get(f"{API}/conferences/", headers=headers_for(other_user))
+    assert response.json()["data"][0]["is_subscribed"] is True
+
+
 def test_update_without_milestones_key_preserves_milestones(
     client: TestClient,
     user: User,
@@ -282,6 +309,350 @@ def test_list_limit_is_clamped(client: TestClient, user: User, headers_for: Head
     assert response.status_code == 422
 
 
+def test_cursor_pagination_walks_every_conference_once(
+    client: TestClient,
+    user: User,
+    headers_for: HeadersFor,
+) -> None:
+    # Equal and missing start dates are where offset ordering was unstable.
+    start_dates = ["2027-06-01", "2027-06-01", "2027-06-01", None, None, "2026-01-01", "2028-01-01"]
+    for i, start_date in enumerate(start_dates):
+        create_conference(client, headers_for(user), name=f"Conference {i}", start_date=start_date)
+
+    seen: list[dict[str, Any]] = []
+    params: dict[str, Any] = {"limit": 2, "with_count": False}
+    while True:
+        response = client.get(f"{API}/conferences/", headers=headers_for(user), params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["count"] is None
+        seen.extend(body["data"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert len({conference["id"] for conference in seen}) == len(start_dates)
+    dated = [conference["start_date"] for conference in seen if conference["start_date"] is not None]
+    assert dated == sorted(dated)
+    assert [conference["start_date"] for conference in seen[-2:]] == [None, None]
+
+
+def test_offset_pagination_reports_count_and_next_cursor(
+    client: TestClient,
+    user: User,
+    headers_for: HeadersFor,
+) -> None:
+    for i in range(3):
+        create_conference(client, headers_for(user), name=f"Conference {i}")
+
+    response = client.get(f"{API}/conferences/", headers=headers_for(user), params={"limit": 2})
+    body = response.json()
+    assert body["count"] == 3
+    assert body["next_cursor"] is not None
+
+    response = client.get(f"{API}/conferences/", headers=headers_for(user), params={"skip": 2, "limit": 2})
+    body = response.json()
+    assert len(body["data"]) == 1
+    assert body["next_cursor"] is None
+
+
+def list_names(client: TestClient, headers: dict[str, str], **params: Any) -> list[str]:
+    response = client.get(f"{API}/conferences/", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["count"] == len(body["data"])
+    return sorted(conference["name"] for conference in body["data"])
+
+
+def test_list_filters_by_name_location_and_dates(
+    client: TestClient,
+    user: User,
+    headers_for: HeadersFor,
+) -> None:
+    headers = headers_for(user)
+    create_conference(client, headers, name="ISTS 2027", start_date="2027-06-01")
+    create_conference(client, headers, name="IAC 2026", start_date="2026-10-01")
+    create_conference(
+        client,
+        headers,
+        name="100% Conference",
+        start_date=None,
+        milestones=[{"name": "Abstract deadline", "date": "2026-03-01"}],
+    )
+
+    assert list_names(client, headers, q="ists") == ["ISTS 2027"]
+    # LIKE wildcards in the search text match literally.
+    assert list_names(client, headers, q="%") == ["100% Conference"]
+    assert list_names(client, headers, location="toky") == ["100% Conference", "IAC 2026", "ISTS 2027"]
+    assert list_names(client, headers, start_from="2027-01-01") == ["ISTS 2027"]
+    assert list_names(client, headers, start_to="2026-12-31") == ["IAC 2026"]
+    assert list_names(client, headers, milestone_before="2026-06-01") == ["100% Conference"]
+
+
+def test_list_filters_by_subscription_and_tags(
+    client: TestClient,
+    user: User,
+    other_user: User,
+    headers_for: HeadersFor,
+) -> None:
+    first = create_conference(client, headers_for(other_user), name="First")
+    second = create_conference(client, headers_for(other_user), name="Second")
+    create_conference(client, headers_for(other_user), name="Third")
+    red = create_tag(client, headers_for(user), name="Red")
+    blue = create_tag(client, headers_for(user), name="Blue")
+    for conference, tags in ((first, [red, blue]), (second, [red])):
+        response = client.put(
+            f"{API}/conferences/{conference['id']}/tags",
+            headers=headers_for(user),
+            json=[tag["id"] for tag in tags],
+        )
+        assert response.status_code == 200, response.text
+    client.post(f"{API}/conferences/{second['id']}/subscribe", headers=headers_for(user))
+
+    headers = headers_for(user)
+    assert list_names(client, headers, subscribed=True) == ["Second"]
+    assert list_names(client, headers, tag_ids=[red["id"], blue["id"]]) == ["First", "Second"]
+    assert list_names(client, headers, tag_ids=[red["id"], blue["id"]], tag_match="all") == ["First"]
+    # Another user's tag ids match nothing for the caller.
+    assert list_names(client, headers_for(other_user), tag_ids=[red["id"]]) == []
+
+
+def test_invalid_cursor_returns_400(client: TestClient, user: User, headers_for: HeadersFor) -> None:
+    response = client.get(f"{API}/conferences/", headers=headers_for(user), params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+def test_cursor_with_skip_returns_400(client: TestClient, user: User, headers_for: HeadersFor) -> None:
+    create_conference(client, headers_for(user), name="Conference 0")
+    create_conference(client, headers_for(user), name="Conference 1")
+    response = client.get(f"{API}/conferences/", headers=headers_for(user), params={"limit": 1})
+    cursor = response.json()["next_cursor"]
+    response = client.get(f"{API}/conferences/", headers=headers_for(user), params={"cursor": cursor, "skip": 1})
+    assert response.status_code == 400
+
+
+# Authenticated user, ETag state (aggregates and own tag assignments), page
+# (with is_subscribed), conferences and milestones missing from the cache,
+# own tags, count.
+LIST_QUERY_BUDGET = 8
+
+
+def test_list_query_count_does_not_grow_with_page_size(
+    client: TestClient,
+    user: User,
+    other_user: User,
+    headers_for: HeadersFor,
+    queries: list[str],
+) -> None:
+    def list_query_count() -> int:
+        conference_cache.clear()
+        queries.clear()
+        response = client.get(f"{API}/conferences/", headers=headers_for(user))
+        assert response.status_code == 200, response.text
+        return len(queries)
+
+    def add_conference(name: str) -> None:
+        conference = create_conference(
+            client,
+            headers_for(user),
+            name=name,
+            milestones=[{"name": "Abstract deadline", "date": "2027-01-15"}],
+        )
+        tag = create_tag(client, headers_for(user), name=f"{name} tag")
+        response = client.post(
+            f"{API}/conferences/{conference['id']}/tags",
+            headers=headers_for(user),
+            params={"tag_id": tag["id"]},
+        )
+        assert response.status_code == 200, response.text
+        response = client.post(f"{API}/conferences/{conference['id']}/subscribe", headers=headers_for(other_user))
+        assert response.status_code == 200, response.text
+
+    add_conference("Conference 0")
+    single = list_query_count()
+    for i in range(1, 10):
+        add_conference(f"Conference {i}")
+    many = list_query_count()
+
+    assert single == many
+    assert many <= LIST_QUERY_BUDGET
+
+
+def test_conference_list_items_match_single_reads(
+    client: TestClient,
+    user: User,
+    headers_for: HeadersFor,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "CHANGES_SAFETY_MARGIN", timedelta(0))
+    conference = create_conference(
+        client,
+        headers_for(user),
+        milestones=[{"name": "Abstract deadline", "date": "2027-01-15", "time": "12:30:00Z"}],
+    )
+    tag = create_tag(client, headers_for(user))
+    client.post(f"{API}/conferences/{conference['id']}/tags", headers=headers_for(user), params={"tag_id": tag["id"]})
+    create_conference(client, headers_for(user), name="Undated", start_date=None)
+
+    for url in (f"{API}/conferences/", f"{API}/conferences/changes"):
+        response = client.get(url, headers=headers_for(user))
+        assert response.status_code == 200, response.text
+        items = response.json()["data"]
+        assert len(items) == 2
+        for item in items:
+            assert client.get(f"{API}/conferences/{item['id']}", headers=headers_for(user)).json() == item
+
+
+def test_warm_list_reuses_cached_conferences(
+    client: TestClient,
+    user: User,
+    other_user: User,
+    headers_for: HeadersFor,
+    queries: list[str],
+) -> None:
+    conference = create_conference(
+        client,
+        headers_for(user),
+        milestones=[{"name": "Abstract deadline", "date": "2027-01-15"}],
+    )
+    tag = create_tag(client, headers_for(user))
+    response = client.post(
+        f"{API}/conferences/{conference['id']}/tags",
+        headers=headers_for(user),
+        params={"tag_id": tag["id"]},
+    )
+    assert response.status_code == 200, response.text
+    url = f"{API}/conferences/"
+    client.get(url, headers=headers_for(other_user))
+
+    queries.clear()
+    response = client.get(url, headers=headers_for(user))
+    assert response.status_code == 200, response.text
+    assert not any("conferencemilestone" in query for query in queries)
+    # The shared entry carries no per-user state.
+    [item] = response.json()["data"]
+    assert [t["name"] for t in item["tags"]] == [tag["name"]]
+    assert item["milestones"][0]["name"] == "Abstract deadline"
+    [other_item] = client.get(url, headers=headers_for(other_user)).json()["data"]
+    assert other_item["tags"] == []
+
+    response = client.put(
+        f"{API}/conferences/{conference['id']}",
+        headers=headers_for(user),
+        json={"name": "Renamed"},
+    )
+    assert response.status_code == 200, response.text
+    [other_item] = client.get(url, headers=headers_for(other_user)).json()["data"]
+    assert other_item["name"] == "Renamed"
+
+
+def test_cached_conference_is_refreshed_when_changed_elsewhere(
+    client: TestClient,
+    session: Session,
+    user: User,
+    headers_for: HeadersFor,
+) -> None:
+    conference = create_conference(client, headers_for(user))
+    url = f"{API}/conferences/"
+    assert client.get(url, headers=headers_for(user)).json()["data"][0]["name"] == conference["name"]
+
+    # A write from another process never touches this process's cache, but
+    # it moves updated_at.
+    row = session.get(Conference, uuid.UUID(conference["id"]))
+    assert row is not None
+    row.name = "Changed elsewhere"
+    row.updated_at = datetime.now(UTC)
+    session.add(row)
+    session.commit()
+
+    assert client.get(url, headers=headers_for(user)).json()["data"][0]["name"] == "Changed elsewhere"
+
+
+def test_conditional_get_returns_304_until_the_list_changes(
+    client: TestClient,
+    user: User,
+    headers_for: HeadersFor,
+    queries: list[str],
+) -> None:
+    headers = headers_for(user)
+    conference = create_conference(client, headers)
+    url = f"{API}/conferences/"
+
+    response = client.get(url, headers=headers)
+    etag = response.headers["ETag"]
+    # No date could track unsubscribes and tag assignments, so none is sent.
+    assert "Last-Modified" not in response.headers
+
+    queries.clear()
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    # Authenticated user, aggregates and tag assignments; no page build.
+    assert len(queries) <= 3
+    if_modified_since = "Fri, 01 Jan 2100 00:00:00 GMT"
+    assert client.get(url, headers={**headers, "If-Modified-Since": if_modified_since}).status_code == 200
+
+    # Per-user tag assignments change the ETag without touching updated_at.
+    tag = create_tag(client, headers)
+    client.post(f"{API}/conferences/{conference['id']}/tags", headers=headers, params={"tag_id": tag["id"]})
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_conditional_get_of_single_conference(client: TestClient, user: User, headers_for: HeadersFor) -> None:
+    headers = headers_for(user)
+    conference = create_conference(client, headers)
+    url = f"{API}/conferences/{conference['id']}"
+
+    etag = client.get(url, headers=headers).headers["ETag"]
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    client.delete(f"{API}/conferences/{conference['id']}/subscribe", headers=headers)
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["is_subscribed"] is False
+
+
+def test_milestone_writes_maintain_the_reminder_schedule(
+    client: TestClient,
+    session: Session,
+    user: User,
+    superuser: User,
+    headers_for: HeadersFor,
+) -> None:
+    def schedule() -> set[tuple[str, int, str]]:
+        session.expire_all()
+        return {
+            (str(due.milestone_id), due.offset_days, due.due_date.isoformat())
+            for due in session.exec(select(ReminderDue)).all()
+        }
+
+    conference = create_conference(
+        client,
+        headers_for(user),
+        milestones=[{"name": "Abstract deadline", "date": "2027-01-31"}],
+    )
+    abstract_id = conference["milestones"][0]["id"]
+    assert schedule() == {(abstract_id, 30, "2027-01-01"), (abstract_id, 7, "2027-01-24")}
+
+    response = client.put(
+        f"{API}/conferences/{conference['id']}",
+        headers=headers_for(user),
+        json={
+            "name": conference["name"],
+            "milestones": [{"name": "Camera-ready", "date": "2027-03-08"}],
+        },
+    )
+    assert response.status_code == 200, response.text
+    camera_ready_id = response.json()["milestones"][0]["id"]
+    assert schedule() == {(camera_ready_id, 30, "2027-02-06"), (camera_ready_id, 7, "2027-03-01")}
+
+    response = client.delete(f"{API}/conferences/{conference['id']}", headers=headers_for(superuser))
+    assert response.status_code == 200, response.text
+    assert schedule() == set()
+
+
 def test_delete_conference_returns_serialized_conference(
     client: TestClient,
     user: User,
@@ -295,3 +666,95 @@ def test_delete_conference_returns_serialized_conference(
 
     response = client.get(f"{API}/conferences/{conference['id']}", headers=headers_for(user))
     assert response.status_code == 404
+
+
+def test_delete_keeps_a_tombstone(
+    client: TestClient,
+    session: Session,
+    user: User,
+    superuser: User,
+    headers_for: HeadersFor,
+) -> None:
+    conference = create_conference(client, headers_for(user))
+    response = client.delete(f"{API}/conferences/{conference['id']}", headers=headers_for(superuser))
+    assert response.status_code == 200, response.text
+
+    tombstone = session.get(Conference, uuid.UUID(conference["id"]))
+    assert tombstone is not None
+    assert tombstone.deleted_at is not None
+    body = client.get(f"{API}/conferences/", headers=headers_for(user)).json()
+    assert body["count"] == 0
+    assert body["data"] == []
+    response = client.put(f"{API}/conferences/{conference['id']}", headers=headers_for(user), json={"name": "Back"})
+    assert response.status_code == 404
+
+
+def test_changes_feed_reports_updates_and_deletions(
+    client: TestClient,
+    user: User,
+    superuser: User,
+    headers_for: HeadersFor,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "CHANGES_SAFETY_MARGIN", timedelta(0))
+    headers = headers_for(user)
+    kept = create_conference(client, headers, name="Kept")
+    renamed = create_conference(client, headers, name="Renamed")
+    deleted = create_conference(client, headers, name="Deleted")
+
+    response = client.get(f"{API}/conferences/changes", headers=headers)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert sorted(conference["name"] for conference in body["data"]) == ["Deleted", "Kept", "Renamed"]
+    assert body["deleted"] == []
+    assert body["has_more"] is False
+
+    # Nothing changed: the next poll is empty.
+    response = client.get(f"{API}/conferences/changes", headers=headers, params={"since": body["next_token"]})
+    assert response.json()["data"] == []
+    token = response.json()["next_token"]
+
+    client.put(f"{API}/conferences/{renamed['id']}", headers=headers, json={"name": "Renamed again"})
+    client.delete(f"{API}/conferences/{deleted['id']}", headers=headers_for(superuser))
+    body = client.get(f"{API}/conferences/changes", headers=headers, params={"since": token}).json()
+    assert [conference["name"] for conference in body["data"]] == ["Renamed again"]
+    assert body["data"][0]["milestones"] == []
+    assert body["deleted"] == [deleted["id"]]
+    assert kept["id"] not in {conference["id"] for conference in body["data"]}
+
+
+def test_changes_feed_pages_with_has_more(
+    client: TestClient,
+    user: User,
+    headers_for: HeadersFor,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "CHANGES_SAFETY_MARGIN", timedelta(0))
+    headers = headers_for(user)
+    for i in range(5):
+        create_conference(client, headers, name=f"Conference {i}")
+
+    seen: list[str] = []
+    params: dict[str, Any] = {"limit": 2}
+    while True:
+        body = client.get(f"{API}/conferences/changes", headers=headers, params=params).json()
+        seen.extend(conference["id"] for conference in body["data"])
+        params["since"] = body["next_token"]
+        if not body["has_more"]:
+            break
+    assert len(set(seen)) == len(seen) == 5
+
+
+def test_changes_feed_withholds_changes_within_the_safety_margin(
+    client: TestClient,
+    user: User,
+    headers_for: HeadersFor,
+) -> None:
+    create_conference(client, headers_for(user))
+    body = client.get(f"{API}/conferences/changes", headers=headers_for(user)).json()
+    assert body["data"] == []
+
+
+def test_invalid_sync_token_returns_400(client: TestClient, user: User, headers_for: HeadersFor) -> None:
+    response = client.get(f"{API}/conferences/changes", headers=headers_for(user), params={"since": "garbage"})
+    assert response.status_code == 400
@@ -1,6 +1,12 @@
+import threading
+from datetime import timedelta
+
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+from scholark.core import security
+from scholark.core.config import settings
 from scholark.models import User
 from tests.conftest import HeadersFor
 
@@ -50,6 +56,31 @@ def test_login_disabled_user_returns_400(client: TestClient, session: Session, u
     assert body["detail"] == "Inactive user"
 
 
+@pytest.mark.usefixtures("user")
+def test_login_is_refused_with_503_while_hashing_is_saturated(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pool = security.HashingPool(workers=1, queue_depth=0)
+    monkeypatch.setattr(security, "hashing_pool", lambda: pool)
+    # Another request is hashing in the only slot.
+    started, release = threading.Event(), threading.Event()
+
+    def hash_slowly() -> None:
+        started.set()
+        release.wait()
+
+    other = threading.Thread(target=pool.run, args=(hash_slowly,))
+    other.start()
+    started.wait()
+    response = client.post(f"{API}/login/access-token", data={"username": "alice", "password": "alicepassword"})
+    release.set()
+    other.join()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
 def test_disabled_user_token_is_rejected_with_401(
     client: TestClient,
     session: Session,
@@ -79,6 +110,53 @@ def test_deleted_user_token_is_rejected_with_401(
     assert response.status_code == 401
 
 
+def test_authenticated_user_is_cached(
+    client: TestClient,
+    session: Session,
+    user: User,
+    headers_for: HeadersFor,
+    queries: list[str],
+) -> None:
+    headers = headers_for(user)
+    assert client.get(f"{API}/tags/", headers=headers).status_code == 200
+    # Requests share the test's session, whose identity map would hide a query.
+    session.expunge_all()
+    queries.clear()
+    assert client.get(f"{API}/tags/", headers=headers).status_code == 200
+    assert not any("user.disabled" in query for query in queries)
+
+
+def test_deleting_a_user_evicts_them_from_the_cache(
+    client: TestClient,
+    user: User,
+    superuser: User,
+    headers_for: HeadersFor,
+) -> None:
+    headers = headers_for(user)
+    assert client.get(f"{API}/tags/", headers=headers).status_code == 200
+
+    response = client.delete(f"{API}/users/{user.id}", headers=headers_for(superuser))
+    assert response.status_code == 200, response.text
+    assert client.get(f"{API}/tags/", headers=headers).status_code == 401
+
+
+def test_cached_user_expires_after_the_ttl(
+    client: TestClient,
+    session: Session,
+    user: User,
+    headers_for: HeadersFor,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "USER_CACHE_TTL", timedelta(0))
+    headers = headers_for(user)
+    assert client.get(f"{API}/tags/", headers=headers).status_code == 200
+    # Disabled behind the API's back, so only the expiry evicts the entry.
+    user.disabled = True
+    session.add(user)
+    session.commit()
+    assert client.get(f"{API}/tags/", headers=headers).status_code == 401
+
+
 def test_invalid_token_returns_401_with_www_authenticate(client: TestClient) -> None:
     response = client.get(f"{API}/users/me", headers={"Authorization": "Bearer garbage"})
     assert response.status_code == 401
@@ -56,3 +56,18 @@ def test_delete_tag_returns_serialized_tag(client: TestClient, user: User, heade
     assert response.status_code == 200, response.text
     assert response.json()["id"] == tag_id
     assert client.get(f"{API}/tags/{tag_id}", headers=headers_for(user)).status_code == 404
+
+
+def test_tag_list_items_match_single_reads(client: TestClient, user: User, headers_for: HeadersFor) -> None:
+    for name in ("Beta", "Alpha"):
+        client.post(f"{API}/tags/", headers=headers_for(user), json={"name": name, "color": "#123abc"})
+
+    response = client.get(f"{API}/tags/", headers=headers_for(user))
+    assert response.status_code == 200, response.text
+    body = response.json()
+    names = [tag["name"] for tag in body["data"]]
+    assert body["count"] == len(names)
+    assert names == sorted(names)
+    assert {"Alpha", "Beta"} <= set(names)
+    for tag in body["data"]:
+        assert client.get(f"{API}/tags/{tag['id']}", headers=headers_for(user)).json() == tag
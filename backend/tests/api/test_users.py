@@ -55,3 +55,26 @@ def test_create_user_without_password_returns_400(
 def test_superuser_cannot_delete_self(client: TestClient, superuser: User, headers_for: HeadersFor) -> None:
     response = client.delete(f"{API}/users/{superuser.id}", headers=headers_for(superuser))
     assert response.status_code == 403
+
+
+def test_user_list_items_match_single_reads(
+    client: TestClient,
+    user: User,
+    superuser: User,
+    headers_for: HeadersFor,
+) -> None:
+    response = client.get(f"{API}/users/", headers=headers_for(superuser))
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["count"] == 2
+    for item in body["data"]:
+        assert client.get(f"{API}/users/{item['id']}", headers=headers_for(superuser)).json() == item
+
+
+def test_update_me_validates_the_timezone(client: TestClient, user: User, headers_for: HeadersFor) -> None:
+    response = client.put(f"{API}/users/me", headers=headers_for(user), json={"timezone": "Mars/Olympus_Mons"})
+    assert response.status_code == 422
+
+    response = client.put(f"{API}/users/me", headers=headers_for(user), json={"timezone": "Asia/Tokyo"})
+    assert response.status_code == 200, response.text
+    assert response.json()["timezone"] == "Asia/Tokyo"
@@ -1,31 +1,82 @@
+from collections.abc import Callable
+
 import pytest
+from sqlalchemy import Engine, event
 from sqlmodel import Session, select
 
+from scholark.auth import db_provider
 from scholark.auth.base import AuthProviderError
 from scholark.auth.db_provider import DbAuthProvider
+from scholark.core import security
 from scholark.models import User, UserCreate
 
 
 def test_authenticate_success(session: Session, user: User) -> None:
-    provider = DbAuthProvider(session)
-    authenticated = provider.authenticate("alice", "alicepassword")
+    provider = DbAuthProvider()
+    authenticated = provider.authenticate(session, "alice", "alicepassword")
     assert authenticated is not None
     assert authenticated.id == user.id
 
 
+def test_authenticate_releases_the_connection_but_keeps_the_user_loaded(
+    engine: Engine,
+    session: Session,
+    user: User,
+    queries: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    checked_out = 0
+
+    def track(delta: int) -> Callable[..., None]:
+        def listener(*_args: object) -> None:
+            nonlocal checked_out
+            checked_out += delta
+
+        return listener
+
+    user_id = user.id
+    session.rollback()
+    event.listen(engine, "checkout", track(1))
+    event.listen(engine, "checkin", track(-1))
+    held_while_hashing: list[int] = []
+
+    def verify_password(plain_password: str, hashed_password: str) -> bool:
+        held_while_hashing.append(checked_out)
+        return security.verify_password(plain_password, hashed_password)
+
+    monkeypatch.setattr(db_provider, "verify_password", verify_password)
+    queries.clear()
+    authenticated = DbAuthProvider().authenticate(session, "alice", "alicepassword")
+
+    assert authenticated is not None
+    assert held_while_hashing == [0]
+    assert (authenticated.id, authenticated.disabled) == (user_id, False)
+    # The user and the credential; reading the user afterwards needs no query.
+    assert len(queries) == 2
+
+
+def test_authenticate_keeps_the_callers_transaction(session: Session, user: User) -> None:
+    pending = User(username="pending")
+    session.add(pending)
+
+    assert DbAuthProvider().authenticate(session, "alice", "alicepassword") is not None
+    session.commit()
+    assert session.exec(select(User).where(User.username == "pending")).one() == pending
+
+
 def test_authenticate_unknown_username_returns_none(session: Session) -> None:
-    assert DbAuthProvider(session).authenticate("nobody", "whatever") is None
+    assert DbAuthProvider().authenticate(session, "nobody", "whatever") is None
 
 
 def test_authenticate_user_without_credential_returns_none(session: Session) -> None:
     # E.g. a user provisioned through LDAP has no DbAuthCredential row.
     session.add(User(username="ldap-user"))
     session.commit()
-    assert DbAuthProvider(session).authenticate("ldap-user", "whatever") is None
+    assert DbAuthProvider().authenticate(session, "ldap-user", "whatever") is None
 
 
 def test_create_user_is_atomic(session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
-    provider = DbAuthProvider(session)
+    provider = DbAuthProvider()
 
     real_commit = session.commit
 
@@ -35,13 +86,13 @@ def test_create_user_is_atomic(session: Session, monkeypatch: pytest.MonkeyPatch
 
     monkeypatch.setattr(session, "commit", failing_commit)
     with pytest.raises(AuthProviderError) as exc_info:
-        provider.create_user(user_create=UserCreate(username="carol", password="carolpassword"))
+        provider.create_user(session, user_create=UserCreate(username="carol", password="carolpassword"))
     assert exc_info.value.status_code == 500
     monkeypatch.setattr(session, "commit", real_commit)
 
     # The failed attempt must not have stranded a credential-less user row:
     # the username is still absent and can be registered normally.
     assert session.exec(select(User).where(User.username == "carol")).first() is None
-    created = provider.create_user(user_create=UserCreate(username="carol", password="carolpassword"))
-    assert provider.authenticate("carol", "carolpassword") is not None
+    created = provider.create_user(session, user_create=UserCreate(username="carol", password="carolpassword"))
+    assert provider.authenticate(session, "carol", "carolpassword") is not None
     assert created.tags  # default tags were provisioned in the same transaction
@@ -1,12 +1,19 @@
+import functools
+from datetime import timedelta
+
 import pytest
+from ldap3 import MOCK_SYNC, Connection, Server
 from sqlmodel import Session, select
 
 import scholark.auth.ldap_provider as ldap_provider_module
 from scholark.auth.base import AuthProviderError
 from scholark.auth.ldap_provider import LdapAuthProvider
+from scholark.core.config import settings
 from scholark.models import User, UserCreate
 
+LDAP_SERVER = "ldap://ldap.example.com"
 DN_PATTERN = "uid={username},ou=users,dc=example,dc=com"
+ALICE_DN = DN_PATTERN.format(username="alice")
 
 
 class FakeConnection:
@@ -15,13 +22,16 @@ class FakeConnection:
     last_user_dn: str | None = None
     bind_result = False
 
-    def __init__(self, _server: str, user: str, password: str) -> None:
+    def __init__(self, _server: Server, user: str, password: str, **_kwargs: object) -> None:
         type(self).last_user_dn = user
         self.password = password
 
     def bind(self) -> bool:
         return type(self).bind_result
 
+    def unbind(self) -> None:
+        pass
+
 
 @pytest.fixture
 def fake_connection(monkeypatch: pytest.MonkeyPatch) -> type[FakeConnection]:
@@ -31,34 +41,50 @@ def fake_connection(monkeypatch: pytest.MonkeyPatch) -> type[FakeConnection]:
     return FakeConnection
 
 
-def make_provider(session: Session) -> LdapAuthProvider:
-    return LdapAuthProvider(session, "ldap://ldap.example.com", DN_PATTERN)
+@pytest.fixture
+def provider() -> LdapAuthProvider:
+    return LdapAuthProvider(LDAP_SERVER, DN_PATTERN)
+
+
+@pytest.fixture
+def directory(provider: LdapAuthProvider, monkeypatch: pytest.MonkeyPatch) -> Connection:
+    """Mock the provider's LDAP server in-process, with alice's password set to "secret".
+
+    Returns a connection whose strategy can add and remove entries.
+    """
+    monkeypatch.setattr(ldap_provider_module, "Connection", functools.partial(Connection, client_strategy=MOCK_SYNC))
+    admin = Connection(provider.server, client_strategy=MOCK_SYNC)
+    admin.strategy.add_entry(ALICE_DN, {"objectClass": "person", "userPassword": "secret"})
+    return admin
 
 
 def test_empty_password_is_rejected_without_binding(
     session: Session,
+    provider: LdapAuthProvider,
     fake_connection: type[FakeConnection],
 ) -> None:
     # An empty password must never reach the LDAP server: servers permitting
     # unauthenticated binds would report success for any username.
-    assert make_provider(session).authenticate("alice", "") is None
+    assert provider.authenticate(session, "alice", "") is None
     assert fake_connection.last_user_dn is None
 
 
 def test_dn_metacharacters_in_username_are_escaped(
     session: Session,
+    provider: LdapAuthProvider,
     fake_connection: type[FakeConnection],
 ) -> None:
-    assert make_provider(session).authenticate("evil,ou=admins", "password") is None
+    assert provider.authenticate(session, "evil,ou=admins", "password") is None
     assert fake_connection.last_user_dn == "uid=evil\\,ou\\=admins,ou=users,dc=example,dc=com"
 
 
 def test_successful_bind_provisions_user(
     session: Session,
+    provider: LdapAuthProvider,
     fake_connection: type[FakeConnection],
 ) -> None:
     fake_connection.bind_result = True
-    user = make_provider(session).authenticate("alice", "password")
+    user = provider.authenticate(session, "alice", "password")
     assert user is not None
     assert user.tags  # default tags provisioned on first login
 
@@ -66,6 +92,52 @@ def test_successful_bind_provisions_user(
     assert stored is not None
 
 
-def test_create_user_is_not_supported(session: Session) -> None:
+@pytest.mark.usefixtures("directory")
+def test_bind_checks_the_password_against_the_directory(session: Session, provider: LdapAuthProvider) -> None:
+    assert provider.authenticate(session, "alice", "wrong") is None
+    assert provider.authenticate(session, "bob", "secret") is None
+    user = provider.authenticate(session, "alice", "secret")
+    assert user is not None
+    assert user.username == "alice"
+
+
+def test_successful_binds_are_remembered_for_the_ttl(
+    session: Session,
+    provider: LdapAuthProvider,
+    directory: Connection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "LDAP_BIND_CACHE_TTL", timedelta(minutes=1))
+    assert provider.authenticate(session, "alice", "secret") is not None
+    assert provider.authenticate(session, "alice", "wrong") is None
+
+    # Gone from the directory, but the earlier bind is still remembered.
+    directory.strategy.remove_entry(ALICE_DN)
+    assert provider.authenticate(session, "alice", "secret") is not None
+    assert provider.authenticate(session, "alice", "wrong") is None
+
+    provider.bind_cache.clear()
+    assert provider.authenticate(session, "alice", "secret") is None
+
+
+def test_binds_are_not_remembered_by_default(
+    session: Session,
+    provider: LdapAuthProvider,
+    directory: Connection,
+) -> None:
+    assert provider.authenticate(session, "alice", "secret") is not None
+    directory.strategy.remove_entry(ALICE_DN)
+    assert provider.authenticate(session, "alice", "secret") is None
+
+
+def test_unreachable_server_is_reported_as_unavailable(session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "LDAP_CONNECT_TIMEOUT", timedelta(seconds=1))
+    # Nothing listens on port 1, so the connection is refused.
+    with pytest.raises(AuthProviderError) as exc_info:
+        LdapAuthProvider("ldap://127.0.0.1:1", DN_PATTERN).authenticate(session, "alice", "secret")
+    assert exc_info.value.status_code == 503
+
+
+def test_create_user_is_not_supported(session: Session, provider: LdapAuthProvider) -> None:
     with pytest.raises(AuthProviderError):
-        make_provider(session).create_user(user_create=UserCreate(username="x", password="passwordx"))
+        provider.create_user(session, user_create=UserCreate(username="x", password="passwordx"))
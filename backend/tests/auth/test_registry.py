@@ -0,0 +1,40 @@
+from collections.abc import Generator
+
+import pytest
+
+from scholark.auth.base import AuthProviderError
+from scholark.auth.db_provider import DbAuthProvider
+from scholark.auth.registry import auth_provider
+from scholark.auth.router import AuthRouter
+from scholark.core.config import settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry() -> Generator[None]:
+    # Other tests may have built the provider from different settings.
+    auth_provider.cache_clear()
+    yield
+    auth_provider.cache_clear()
+
+
+def test_provider_is_built_once() -> None:
+    provider = auth_provider()
+    assert isinstance(provider, DbAuthProvider)
+    assert auth_provider() is provider
+
+
+def test_ldap_provider_routes_preserved_usernames_to_the_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "AUTH_PROVIDER", "ldap")
+    monkeypatch.setattr(settings, "LDAP_SERVER", "ldap://ldap.example.com")
+    monkeypatch.setattr(settings, "LDAP_DN_PATTERN", "uid={username},ou=users,dc=example,dc=com")
+    provider = auth_provider()
+    assert isinstance(provider, AuthRouter)
+    assert provider.preserved_db_usernames == settings.PRESERVED_DB_USERNAMES
+
+
+def test_incomplete_ldap_settings_are_an_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "AUTH_PROVIDER", "ldap")
+    monkeypatch.setattr(settings, "LDAP_SERVER", None)
+    with pytest.raises(AuthProviderError) as exc_info:
+        auth_provider()
+    assert exc_info.value.status_code == 500
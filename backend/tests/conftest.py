@@ -23,6 +23,7 @@ from sqlmodel.pool import StaticPool
 
 from scholark.api.deps import get_db
 from scholark.auth.db_provider import DbAuthProvider
+from scholark.core.cache import conference_cache, user_cache
 from scholark.core.security import create_access_token
 from scholark.main import app
 from scholark.models import User, UserCreate
@@ -57,6 +58,16 @@ def session(engine: Engine) -> Generator[Session]:
         yield session
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Generator[None]:
+    # Each test gets a fresh database, so entries must not leak between tests.
+    conference_cache.clear()
+    user_cache.clear()
+    yield
+    conference_cache.clear()
+    user_cache.clear()
+
+
 @pytest.fixture
 def client(session: Session) -> Generator[TestClient]:
     def _get_db_override() -> Generator[Session]:
@@ -67,23 +78,39 @@ def client(session: Session) -> Generator[TestClient]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def queries(engine: Engine) -> Generator[list[str]]:
+    """Record the SQL statements executed on the test engine, for query-count budgets."""
+    statements: list[str] = []
+
+    def _record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture
 def user(session: Session) -> User:
-    return DbAuthProvider(session).create_user(
+    return DbAuthProvider().create_user(
+        session,
         user_create=UserCreate(username="alice", password="alicepassword"),
     )
 
 
 @pytest.fixture
 def other_user(session: Session) -> User:
-    return DbAuthProvider(session).create_user(
+    return DbAuthProvider().create_user(
+        session,
         user_create=UserCreate(username="bob", password="bobpassword"),
     )
 
 
 @pytest.fixture
 def superuser(session: Session) -> User:
-    return DbAuthProvider(session).create_user(
+    return DbAuthProvider().create_user(
+        session,
         user_create=UserCreate(username="admin", password="adminpassword", is_superuser=True),
     )
 
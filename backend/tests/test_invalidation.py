@@ -0,0 +1,58 @@
+import uuid
+from collections import defaultdict
+
+import pytest
+from sqlmodel import Session
+
+from scholark.core import invalidation
+from scholark.core.cache import LRUCache
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> LRUCache[uuid.UUID, str]:
+    monkeypatch.setattr(invalidation, "_subscriptions", defaultdict(list))
+    cache: LRUCache[uuid.UUID, str] = LRUCache(10)
+    invalidation.subscribe("thing", cache, uuid.UUID)
+    return cache
+
+
+def test_publish_invalidates_after_commit(session: Session, cache: LRUCache[uuid.UUID, str]) -> None:
+    key, other_key = uuid.uuid4(), uuid.uuid4()
+    cache.set(key, "stale")
+    cache.set(other_key, "fresh")
+
+    invalidation.publish(session, "thing", key)
+    assert cache.get(key) == "stale"
+    session.commit()
+
+    assert cache.get(key) is None
+    assert cache.get(other_key) == "fresh"
+
+
+def test_publish_is_discarded_on_rollback(session: Session, cache: LRUCache[uuid.UUID, str]) -> None:
+    key = uuid.uuid4()
+    cache.set(key, "value")
+
+    invalidation.publish(session, "thing", key)
+    session.rollback()
+    session.commit()
+
+    assert cache.get(key) == "value"
+
+
+def test_apply_ignores_unknown_kinds_and_malformed_keys(cache: LRUCache[uuid.UUID, str]) -> None:
+    key = uuid.uuid4()
+    cache.set(key, "value")
+
+    invalidation.apply(f"other:{key}")
+    invalidation.apply("thing:not-a-uuid")
+    assert cache.get(key) == "value"
+
+    invalidation.apply(f"thing:{key}")
+    assert cache.get(key) is None
+
+
+def test_clear_all_drops_subscribed_caches(cache: LRUCache[uuid.UUID, str]) -> None:
+    cache.set(uuid.uuid4(), "value")
+    invalidation.clear_all()
+    assert len(cache) == 0
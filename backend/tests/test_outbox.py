@@ -0,0 +1,101 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+from sqlmodel import Session, col, select
+
+from scholark import outbox
+from scholark.core.config import settings
+from scholark.models import OutboxMessage, User
+from tests.conftest import HeadersFor
+from tests.test_slack import RecordingClient
+
+
+@pytest.fixture
+def slack_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "SLACK_BOT_TOKEN", "xoxb-test")
+    monkeypatch.setattr(settings, "SLACK_CHANNEL_ID", "C123")
+    monkeypatch.setattr(settings, "SLACK_MESSAGES_PER_SECOND", 1000.0)
+    monkeypatch.setattr(settings, "SLACK_MAX_RETRIES", 0)
+    monkeypatch.setattr("scholark.slack.SLACK_CHANNEL_INTERVAL", 0.0)
+
+
+@pytest.mark.usefixtures("slack_configured")
+def test_new_conference_is_announced_through_the_outbox(
+    client: TestClient,
+    session: Session,
+    user: User,
+    headers_for: HeadersFor,
+) -> None:
+    response = client.post(f"{settings.API_V1_STR}/conferences/", headers=headers_for(user), json={"name": "ISTS"})
+    assert response.status_code == 200, response.text
+
+    [message] = session.exec(select(OutboxMessage)).all()
+    assert message.channel == "C123"
+    assert "ISTS" in message.text
+    text = message.text
+
+    slack_client = RecordingClient()
+    assert outbox.drain(session, slack_client) == 1  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
+    assert slack_client.messages == [("C123", text)]
+    assert session.exec(select(OutboxMessage)).all() == []
+
+
+@pytest.mark.usefixtures("slack_configured")
+def test_failed_messages_are_retried_later_then_given_up(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(outbox, "OUTBOX_MAX_ATTEMPTS", 2)
+    outbox.enqueue(session, "Hello")
+    session.commit()
+    slack_client = RecordingClient()
+    slack_client.unreachable = {"C123"}
+
+    assert outbox.drain(session, slack_client) == 1  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
+    message = session.exec(select(OutboxMessage)).one()
+    assert message.attempts == 1
+    assert message.next_attempt_at is not None
+    assert message.next_attempt_at.replace(tzinfo=UTC) > datetime.now(UTC)
+    # Not due yet.
+    assert outbox.drain(session, slack_client) == 0  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
+
+    message.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    session.add(message)
+    session.commit()
+    assert outbox.drain(session, slack_client) == 1  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
+    message = session.exec(select(OutboxMessage)).one()
+    assert (message.attempts, message.next_attempt_at) == (2, None)
+    assert outbox.drain(session, slack_client) == 0  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
+
+
+class LeaseCheckingClient(RecordingClient):
+    """Record, as each message is sent, whether the outbox still has a transaction open."""
+
+    def __init__(self, engine: Engine, session: Session) -> None:
+        super().__init__()
+        self.engine = engine
+        self.session = session
+        self.checks: list[tuple[bool, int]] = []
+
+    def chat_postMessage(self, *, channel: str, text: str) -> None:  # noqa: N802
+        with Session(self.engine) as other_session:
+            due = other_session.exec(
+                select(OutboxMessage).where(col(OutboxMessage.next_attempt_at) <= datetime.now(UTC)),
+            ).all()
+        self.checks.append((self.session.in_transaction(), len(due)))
+        super().chat_postMessage(channel=channel, text=text)
+
+
+@pytest.mark.usefixtures("slack_configured")
+def test_claimed_messages_are_leased_while_sending(engine: Engine, session: Session) -> None:
+    for i in range(3):
+        outbox.enqueue(session, f"Hello {i}")
+    session.commit()
+    slack_client = LeaseCheckingClient(engine, session)
+
+    assert outbox.drain(session, slack_client, batch_size=2) == 2  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]
+    # Sent outside any transaction, with only the unclaimed message due for other workers.
+    assert slack_client.checks == [(False, 1), (False, 1)]
+    assert [message.text for message in session.exec(select(OutboxMessage)).all()] == ["Hello 2"]
@@ -0,0 +1,29 @@
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlmodel import Session, select
+
+from scholark import reminders
+from scholark.core.config import settings
+from scholark.models import Conference, ConferenceMilestone, ReminderDue
+
+
+def test_rebuild_applies_the_configured_offsets(session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    live = Conference(name="Live", created_by_user_id=None)
+    live.milestones = [ConferenceMilestone(name="Paper", date=date(2027, 3, 1), conference_id=live.id)]
+    deleted = Conference(name="Deleted", created_by_user_id=None, deleted_at=datetime(2026, 1, 1, tzinfo=UTC))
+    deleted.milestones = [ConferenceMilestone(name="Gone", date=date(2027, 3, 1), conference_id=deleted.id)]
+    session.add_all([live, deleted])
+    session.flush()
+    reminders.schedule(session, [*live.milestones, *deleted.milestones])
+    session.commit()
+
+    monkeypatch.setattr(settings, "REMINDER_OFFSETS_DAYS", [14, 1])
+    assert reminders.rebuild_schedule(session) == 2
+    session.commit()
+
+    schedule = session.exec(select(ReminderDue)).all()
+    assert {(due.milestone_id, due.offset_days, due.due_date) for due in schedule} == {
+        (live.milestones[0].id, 14, date(2027, 2, 15)),
+        (live.milestones[0].id, 1, date(2027, 2, 28)),
+    }
@@ -0,0 +1,43 @@
+import threading
+import time
+from datetime import timedelta
+
+from sqlalchemy import Engine, literal
+from sqlmodel import Session, select
+
+from scholark.scheduler import Job, Scheduler
+
+
+def test_job_lock_keys_are_stable_and_distinct() -> None:
+    reminders = Job("milestone-reminders", timedelta(hours=1), lambda _: None)
+    assert reminders.lock_key == Job("milestone-reminders", timedelta(minutes=1), print).lock_key
+    assert reminders.lock_key != Job("outbox", timedelta(hours=1), lambda _: None).lock_key
+
+
+def test_jobs_repeat_at_their_interval_and_survive_failures(engine: Engine) -> None:
+    runs: list[str] = []
+    enough = threading.Event()
+
+    def query(session: Session) -> None:
+        session.exec(select(literal(1))).one()
+        runs.append("query")
+        if runs.count("query") >= 3 and runs.count("fail") >= 3:
+            enough.set()
+
+    def fail(_session: Session) -> None:
+        runs.append("fail")
+        raise RuntimeError
+
+    scheduler = Scheduler(
+        engine,
+        [Job("query", timedelta(milliseconds=10), query), Job("fail", timedelta(milliseconds=10), fail)],
+    )
+    scheduler.start()
+    assert enough.wait(timeout=5)
+    scheduler.stop()
+    scheduler.join()
+
+    # A failing job keeps its schedule, and stopped jobs stay stopped.
+    finished = len(runs)
+    time.sleep(0.05)
+    assert len(runs) == finished
@@ -0,0 +1,33 @@
+import threading
+
+import pytest
+
+from scholark.core import security
+
+
+def test_hashing_pool_turns_callers_away_when_full() -> None:
+    pool = security.HashingPool(workers=2, queue_depth=0)
+    started = threading.Barrier(3)
+    release = threading.Event()
+
+    def hash_slowly() -> None:
+        started.wait()
+        release.wait()
+
+    callers = [threading.Thread(target=pool.run, args=(hash_slowly,)) for _ in range(2)]
+    for caller in callers:
+        caller.start()
+    started.wait()
+    with pytest.raises(security.PasswordHashingBusyError):
+        pool.run(pow, 2, 10)
+
+    release.set()
+    for caller in callers:
+        caller.join()
+    assert pool.run(pow, 2, 10) == 1024
+
+
+def test_password_round_trip() -> None:
+    hashed = security.get_password_hash("correct horse")
+    assert security.verify_password("correct horse", hashed)
+    assert not security.verify_password("battery staple", hashed)
@@ -1,10 +1,23 @@
-from datetime import date
+import itertools
+import json
+import threading
+import time
+from collections.abc import Generator
+from datetime import UTC, date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, cast
+from zoneinfo import ZoneInfo
 
 import pytest
+from slack_sdk import WebClient
+from sqlmodel import Session, select
 
+from scholark import reminders, slack
+from scholark.cli.send_reminders import write_prometheus_textfile
 from scholark.core.config import settings
-from scholark.models import Conference, ConferenceMilestone
-from scholark.slack import build_new_conference_message
+from scholark.models import Conference, ConferenceMilestone, ConferenceSubscription, ReminderDelivery, User
+from scholark.slack import SlackDispatcher, build_new_conference_message
 
 
 def make_conference() -> Conference:
@@ -39,3 +52,385 @@ def test_message_content(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "<https://ists.example.com|Website>" in message
     # Milestones are listed in date order.
     assert message.index("Abstract deadline") < message.index("Paper deadline")
+
+
+class RecordingClient:
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, str]] = []
+        self.unreachable: set[str] = set()
+
+    def chat_postMessage(self, *, channel: str, text: str) -> None:  # noqa: N802
+        if channel in self.unreachable:
+            raise ConnectionError(channel)
+        self.messages.append((channel, text))
+
+
+@pytest.fixture
+def recording_client(monkeypatch: pytest.MonkeyPatch) -> RecordingClient:
+    client = RecordingClient()
+    monkeypatch.setattr(slack, "_get_slack_client", lambda: client)
+    monkeypatch.setattr(settings, "SLACK_MESSAGES_PER_SECOND", 1000.0)
+    monkeypatch.setattr(slack, "SLACK_CHANNEL_INTERVAL", 0.0)
+    return client
+
+
+def seed_due_milestones(session: Session) -> None:
+    """Subscribe four users (three with a Slack id) to three conferences with two due milestones each."""
+    today = datetime.now(tz=ZoneInfo(settings.REMINDER_TIMEZONE)).date()
+    users = [User(username=f"user{i}", slack_user_id=f"U{i}") for i in range(3)]
+    users.append(User(username="no-slack"))
+    session.add_all(users)
+    conferences = []
+    for i in range(3):
+        conference = make_conference()
+        conference.name = f"Conference {i}"
+        conference.milestones = [
+            ConferenceMilestone(name="Due in a week", date=today + timedelta(days=7), conference_id=conference.id),
+            ConferenceMilestone(name="Due in a month", date=today + timedelta(days=30), conference_id=conference.id),
+            ConferenceMilestone(name="Not due", date=today + timedelta(days=8), conference_id=conference.id),
+        ]
+        conferences.append(conference)
+    deleted = make_conference()
+    deleted.deleted_at = datetime.now(UTC)
+    deleted.milestones = [ConferenceMilestone(name="Gone", date=today + timedelta(days=7), conference_id=deleted.id)]
+    session.add_all([*conferences, deleted])
+    session.flush()
+    # The deleted conference stays scheduled here, to check the job skips it regardless.
+    reminders.schedule(session, itertools.chain(*(conference.milestones for conference in [*conferences, deleted])))
+    session.add_all(
+        ConferenceSubscription(user_id=user.id, conference_id=conference.id)
+        for conference in [*conferences, deleted]
+        for user in users
+    )
+    session.commit()
+    session.expunge_all()
+
+
+def test_reminders_are_selected_in_one_query(
+    session: Session,
+    queries: list[str],
+    recording_client: RecordingClient,
+) -> None:
+    seed_due_milestones(session)
+
+    queries.clear()
+    slack.send_milestone_reminders(session)
+
+    # The users' timezones, then one select for the recipients sharing a
+    # local date, and one batched insert into the delivery log.
+    assert [query.split()[0] for query in queries] == ["SELECT", "SELECT", "INSERT"]
+    messages = recording_client.messages
+    # Three conferences, two due milestones each, three users with a Slack id.
+    assert len(messages) == 18
+    assert {channel for channel, _ in messages} == {"U0", "U1", "U2"}
+    assert not any("Not due" in text or "Gone" in text for _, text in messages)
+    assert sum("is in 7 days" in text for _, text in messages) == 9
+
+
+def test_digest_sends_one_message_per_user(
+    session: Session,
+    recording_client: RecordingClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "REMINDER_DIGEST", True)
+    seed_due_milestones(session)
+
+    slack.send_milestone_reminders(session)
+
+    messages = recording_client.messages
+    assert sorted(channel for channel, _ in messages) == ["U0", "U1", "U2"]
+    for _, text in messages:
+        lines = text.splitlines()
+        assert len([line for line in lines if line.startswith("• ")]) == 6
+        # Milestones are listed in date order.
+        assert text.index("is in 7 days") < text.index("is in 30 days")
+        assert "Not due" not in text
+
+
+@pytest.mark.parametrize("digest", [False, True])
+def test_rerun_sends_only_undelivered_reminders(
+    session: Session,
+    recording_client: RecordingClient,
+    monkeypatch: pytest.MonkeyPatch,
+    digest: bool,  # noqa: FBT001
+) -> None:
+    monkeypatch.setattr(settings, "REMINDER_DIGEST", digest)
+    monkeypatch.setattr(settings, "SLACK_MAX_RETRIES", 0)
+    seed_due_milestones(session)
+    recording_client.unreachable = {"U1"}
+
+    slack.send_milestone_reminders(session)
+    assert {channel for channel, _ in recording_client.messages} == {"U0", "U2"}
+    deliveries = session.exec(select(ReminderDelivery)).all()
+    assert len(deliveries) == 12
+    assert sorted({delivery.offset_days for delivery in deliveries}) == [7, 30]
+
+    # The rerun only catches up on the user Slack could not reach before.
+    recording_client.messages.clear()
+    recording_client.unreachable.clear()
+    slack.send_milestone_reminders(session)
+    assert {channel for channel, _ in recording_client.messages} == {"U1"}
+    assert len(session.exec(select(ReminderDelivery)).all()) == 18
+
+    recording_client.messages.clear()
+    slack.send_milestone_reminders(session)
+    assert recording_client.messages == []
+
+
+def test_failing_recipient_does_not_bring_the_timezone_back(
+    session: Session,
+    queries: list[str],
+    recording_client: RecordingClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "SLACK_MAX_RETRIES", 0)
+    seed_due_milestones(session)
+    # E.g. a deactivated Slack user: every attempt fails.
+    recording_client.unreachable = {"U1"}
+
+    evaluated: dict[str, date] = {}
+    metrics = slack.send_milestone_reminders(session, evaluated=evaluated)
+    assert metrics.messages_failed == 6
+    assert {channel for channel, _ in recording_client.messages} == {"U0", "U2"}
+    assert list(evaluated) == [settings.REMINDER_TIMEZONE]
+
+    # Later runs that day neither query the bucket nor retry the recipient.
+    recording_client.messages.clear()
+    queries.clear()
+    metrics = slack.send_milestone_reminders(session, evaluated=evaluated)
+    assert (metrics.messages_built, metrics.messages_failed) == (0, 0)
+    assert [query.split()[0] for query in queries] == ["SELECT"]
+
+
+def test_moved_milestone_is_reminded_again(session: Session, recording_client: RecordingClient) -> None:
+    today = datetime.now(tz=ZoneInfo(settings.REMINDER_TIMEZONE)).date()
+    user = User(username="user", slack_user_id="U0")
+    conference = make_conference()
+    conference.milestones = [ConferenceMilestone(name="Paper deadline", date=today, conference_id=conference.id)]
+    session.add_all([user, conference])
+    session.flush()
+    reminders.schedule(session, conference.milestones)
+    session.add(ConferenceSubscription(user_id=user.id, conference_id=conference.id))
+    # The 7-day reminder went out a week ago.
+    session.add(ReminderDelivery(user_id=user.id, milestone_id=conference.milestones[0].id, offset_days=7))
+    session.commit()
+
+    # The deadline is extended by a week, so that reminder is due again today.
+    conference.milestones[0].date = today + timedelta(days=7)
+    reminders.reschedule(session, conference)
+    session.commit()
+
+    slack.send_milestone_reminders(session)
+    assert len(recording_client.messages) == 1
+    assert "is in 7 days" in recording_client.messages[0][1]
+
+
+def test_reminders_follow_each_users_local_date(
+    session: Session,
+    queries: list[str],
+    recording_client: RecordingClient,
+) -> None:
+    # 25 hours apart, so their local dates always differ.
+    east, west = "Pacific/Kiritimati", "Pacific/Pago_Pago"
+    users = [
+        User(username="east", slack_user_id="Ueast", timezone=east),
+        User(username="west", slack_user_id="Uwest", timezone=west),
+    ]
+    conference = make_conference()
+    east_today = datetime.now(tz=ZoneInfo(east)).date()
+    conference.milestones = [
+        ConferenceMilestone(name="Due in the east", date=east_today + timedelta(days=7), conference_id=conference.id),
+    ]
+    session.add_all([*users, conference])
+    session.flush()
+    reminders.schedule(session, conference.milestones)
+    session.add_all(ConferenceSubscription(user_id=user.id, conference_id=conference.id) for user in users)
+    session.commit()
+
+    evaluated: dict[str, date] = {}
+    queries.clear()
+    slack.send_milestone_reminders(session, evaluated=evaluated)
+    assert [channel for channel, _ in recording_client.messages] == ["Ueast"]
+    # One recipient query per local date.
+    assert sum(query.startswith("SELECT") for query in queries) == 3
+    assert evaluated == {east: east_today, west: datetime.now(tz=ZoneInfo(west)).date()}
+
+    # Timezones already evaluated for their local date are not evaluated again.
+    queries.clear()
+    slack.send_milestone_reminders(session, evaluated=evaluated)
+    assert [query.split()[0] for query in queries] == ["SELECT"]
+
+    # One last evaluated on an earlier date is, however long ago its day began.
+    evaluated[east] -= timedelta(days=1)
+    queries.clear()
+    slack.send_milestone_reminders(session, evaluated=evaluated)
+    assert [query.split()[0] for query in queries] == ["SELECT", "SELECT"]
+
+
+def test_dry_run_builds_every_message_without_sending(session: Session, tmp_path: Path) -> None:
+    seed_due_milestones(session)
+
+    # Slack is not configured, which a dry run does not need.
+    metrics = slack.send_milestone_reminders(session, dry_run=True)
+
+    assert (metrics.messages_built, metrics.messages_sent, metrics.messages_failed) == (18, 0, 0)
+    assert 0 < metrics.query_seconds <= metrics.wall_seconds
+    assert session.exec(select(ReminderDelivery)).all() == []
+
+    metrics_file = tmp_path / "reminders.prom"
+    write_prometheus_textfile(metrics_file, metrics)
+    assert 'scholark_reminders_messages_built{dry_run="true"} 18' in metrics_file.read_text().splitlines()
+
+
+class StubSlackHandler(BaseHTTPRequestHandler):
+    """Answer chat.postMessage like Slack, failing first attempts on request."""
+
+    # Keep connections open between requests, as Slack does.
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        channel = json.loads(body)["channel"]
+        server = cast("StubSlackServer", self.server)
+        with server.lock:
+            server.requests.append((channel, time.monotonic()))
+            attempt = sum(requested == channel for requested, _ in server.requests)
+        if channel == "U429" and attempt == 1:
+            self.respond(429, {"ok": False, "error": "ratelimited"}, {"Retry-After": "1"})
+        elif channel == "U500" and attempt <= 2:
+            self.respond(500, {"ok": False, "error": "internal_error"})
+        elif channel == "Ugone":
+            self.respond(200, {"ok": False, "error": "channel_not_found"})
+        else:
+            self.respond(200, {"ok": True})
+        if channel == "Uclose":
+            self.close_connection = True
+
+    def respond(self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        encoded = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class StubSlackServer(ThreadingHTTPServer):
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubSlackHandler)
+        self.lock = threading.Lock()
+        self.requests: list[tuple[str, float]] = []
+        self.connections = 0
+
+    def get_request(self) -> tuple[Any, Any]:
+        with self.lock:
+            self.connections += 1
+        return super().get_request()
+
+
+@pytest.fixture
+def stub_slack() -> Generator[StubSlackServer]:
+    server = StubSlackServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    slack.connection_pool.discard()
+
+
+def stub_client(server: StubSlackServer) -> WebClient:
+    return slack.PooledWebClient(token="xoxb-test", base_url=f"http://127.0.0.1:{server.server_port}/api/")
+
+
+def test_dispatcher_retries_and_honours_retry_after(stub_slack: StubSlackServer) -> None:
+    channels = ["U429", "U500", "Ugone", *(f"U{i}" for i in range(10))]
+    with SlackDispatcher(
+        stub_client(stub_slack),
+        max_workers=4,
+        messages_per_second=1000,
+        channel_interval=0,
+        backoff_base=0.01,
+    ) as dispatcher:
+        for channel in channels:
+            dispatcher.submit(channel, "Hello", description=f"message to {channel}")
+
+    assert dispatcher.sent == len(channels) - 1
+    assert dispatcher.failed == 1
+    assert dispatcher.rate_limited == 1
+    attempts = [channel for channel, _ in stub_slack.requests]
+    assert attempts.count("U429") == 2
+    assert attempts.count("U500") == 3
+    assert attempts.count("Ugone") == 1
+    # Every request started after the 429 waited for its Retry-After.
+    rate_limited_at = next(at for channel, at in stub_slack.requests if channel == "U429")
+    first_retry_at = next(at for channel, at in stub_slack.requests if channel == "U429" and at > rate_limited_at)
+    assert first_retry_at - rate_limited_at >= 0.9
+
+
+def test_dispatcher_gives_up_after_max_retries(stub_slack: StubSlackServer) -> None:
+    with SlackDispatcher(
+        stub_client(stub_slack),
+        messages_per_second=1000,
+        max_retries=1,
+        channel_interval=0,
+        backoff_base=0.01,
+    ) as dispatcher:
+        dispatcher.submit("U500", "Hello", description="message to U500")
+
+    assert (dispatcher.sent, dispatcher.failed) == (0, 1)
+    assert len(stub_slack.requests) == 2
+
+
+def test_dispatcher_spaces_messages_to_the_same_channel(stub_slack: StubSlackServer) -> None:
+    with SlackDispatcher(
+        stub_client(stub_slack),
+        max_workers=4,
+        messages_per_second=1000,
+        channel_interval=0.2,
+    ) as dispatcher:
+        for _ in range(3):
+            dispatcher.submit("U1", "Hello", description="message to U1")
+
+    times = sorted(at for _, at in stub_slack.requests)
+    assert all(later - earlier >= 0.15 for earlier, later in itertools.pairwise(times))
+
+
+def test_pooled_client_sends_through_the_pool(stub_slack: StubSlackServer) -> None:
+    # PooledWebClient overrides a private WebClient method; if slack_sdk stops
+    # calling it, requests still succeed but bypass the pool.
+    assert stub_client(stub_slack).chat_postMessage(channel="U1", text="Hello")["ok"]
+
+    assert slack.connection_pool.check_out(("http", f"127.0.0.1:{stub_slack.server_port}")) is not None
+
+
+def test_pooled_client_reuses_connections(stub_slack: StubSlackServer) -> None:
+    # Two dispatchers in a row, as consecutive scheduler runs use, each with its own threads.
+    for _ in range(2):
+        with SlackDispatcher(
+            stub_client(stub_slack),
+            max_workers=4,
+            messages_per_second=1000,
+            channel_interval=0,
+        ) as dispatcher:
+            for i in range(50):
+                dispatcher.submit(f"U{i}", "Hello", description=f"message to U{i}")
+        assert dispatcher.sent == 50
+
+    # At most one connection per concurrent worker, reused by the second dispatcher.
+    assert stub_slack.connections <= 4
+
+
+def test_pooled_client_reconnects_after_the_server_closes(stub_slack: StubSlackServer) -> None:
+    client = stub_client(stub_slack)
+    # The stub drops the connection after answering Uclose, without saying so.
+    for channel in ["Uclose", "U1", "U2"]:
+        assert client.chat_postMessage(channel=channel, text="Hello")["ok"]
+
+    assert [channel for channel, _ in stub_slack.requests] == ["Uclose", "U1", "U2"]
+    assert stub_slack.connections == 2
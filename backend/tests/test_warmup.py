@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import QueuePool
+from sqlmodel import create_engine
+
+from scholark.auth.db_provider import dummy_password_hash
+from scholark.core.warmup import open_connections, warm_up
+from scholark.main import app
+
+
+def test_warm_up_primes_lazy_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'warmup.db'}")
+    monkeypatch.setattr(app, "openapi_schema", None)
+    dummy_password_hash.cache_clear()
+
+    timings = warm_up(app, engine, connections=3)
+
+    assert set(timings) == {"connections", "auth_provider", "dummy_password_hash", "openapi"}
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.checkedin() == 3
+    assert dummy_password_hash.cache_info().currsize == 1
+    assert app.openapi_schema is not None
+    engine.dispose()
+
+
+def test_warm_connections_are_capped_at_the_pool_size(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'warmup.db'}", pool_size=2, max_overflow=0, pool_timeout=0.1)
+
+    # More than the pool can hold would otherwise time out waiting for a connection.
+    assert open_connections(engine, 50) == 2
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.checkedin() == 2
+    engine.dispose()
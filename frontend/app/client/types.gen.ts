@@ -239,7 +239,11 @@ export type ConferencesPublic = {
   /**
    * Count
    */
-  count: number;
+  count: number | null;
+  /**
+   * Next Cursor
+   */
+  next_cursor?: string | null;
 };
 
 /**
@@ -386,6 +390,10 @@ export type UserPublic = {
    * Slack User Id
    */
   slack_user_id?: string | null;
+  /**
+   * Timezone
+   */
+  timezone?: string | null;
 };
 
 /**
@@ -410,6 +418,10 @@ export type UserUpdateMe = {
    * Slack User Id
    */
   slack_user_id?: string | null;
+  /**
+   * Timezone
+   */
+  timezone?: string | null;
 };
 
 /**
@@ -545,13 +557,69 @@ export type ConferencesPublicWritable = {
   /**
    * Count
    */
-  count: number;
+  count: number | null;
+  /**
+   * Next Cursor
+   */
+  next_cursor?: string | null;
 };
 
 export type ConferencesReadConferencesData = {
   body?: never;
   path?: never;
   query?: {
+    /**
+     * Q
+     *
+     * Case-insensitive substring of the conference name
+     */
+    q?: string | null;
+    /**
+     * Start From
+     */
+    start_from?: string | null;
+    /**
+     * Start To
+     */
+    start_to?: string | null;
+    /**
+     * End From
+     */
+    end_from?: string | null;
+    /**
+     * End To
+     */
+    end_to?: string | null;
+    /**
+     * Location
+     *
+     * Case-insensitive substring of the location
+     */
+    location?: string | null;
+    /**
+     * Milestone Before
+     *
+     * Only conferences with a milestone strictly before this date
+     */
+    milestone_before?: string | null;
+    /**
+     * Tag Ids
+     *
+     * Only conferences tagged with the user's tags
+     */
+    tag_ids?: Array<string> | null;
+    /**
+     * Tag Match
+     *
+     * Whether conferences need any or all of tag_ids
+     */
+    tag_match?: "any" | "all";
+    /**
+     * Subscribed
+     *
+     * Only conferences the user is subscribed to
+     */
+    subscribed?: boolean;
     /**
      * Skip
      */
@@ -560,6 +628,14 @@ export type ConferencesReadConferencesData = {
      * Limit
      */
     limit?: number;
+    /**
+     * Cursor
+     */
+    cursor?: string | null;
+    /**
+     * With Count
+     */
+    with_count?: boolean;
   };
   url: "/api/v1/conferences/";
 };
@@ -12,25 +12,27 @@ interface FetchAllResult<T> {
 
 /**
  * Fetch every page of the conferences list. A single request returns at
- * most 100 rows, so without paging the 101st conference silently
- * disappears while count still reports the true total.
+ * most 100 rows, so the list is walked with the keyset cursor returned by
+ * the backend; offset paging would rescan every earlier row per page.
  */
 export async function fetchAllConferences(headers: {
   Authorization: string;
 }): Promise<FetchAllResult<ConferencePublic>> {
   const all: ConferencePublic[] = [];
-  for (let skip = 0; ; skip += PAGE_LIMIT) {
+  let cursor: string | undefined;
+  for (;;) {
     const { data, error, response } = await conferencesReadConferences({
       headers,
-      query: { skip, limit: PAGE_LIMIT },
+      query: { limit: PAGE_LIMIT, cursor, with_count: false },
     });
     if (error || !data) {
       return { error, response };
     }
     all.push(...data.data);
-    if (all.length >= data.count || data.data.length === 0) {
+    if (!data.next_cursor) {
       return { data: { data: all, count: all.length }, response };
     }
+    cursor = data.next_cursor;
   }
 }
 
@@ -39,10 +39,11 @@ export async function action({ request }: Route.ActionArgs) {
   const { session, authHeaders } = await requireSession(request);
   const formData = await request.formData();
   const slackUserId = formData.get("slack_user_id") as string | null;
+  const timezone = formData.get("timezone") as string | null;
 
   const { error, response } = await usersUpdateUserMe({
     headers: authHeaders,
-    body: { slack_user_id: slackUserId || null },
+    body: { slack_user_id: slackUserId || null, timezone: timezone || null },
   });
   if (error) {
     await logoutIfUnauthorized(session, response);
@@ -225,7 +226,8 @@ export default function Settings({ loaderData }: Route.ComponentProps) {
       <p className="text-sm text-gray-500 mb-2">
         Enter your Slack Member ID to receive milestone reminders via DM. You can find your Member
         ID in Slack by clicking your profile picture, then "Profile", then the three-dot menu, and
-        "Copy member ID".
+        "Copy member ID". Reminders are sent on your local date in the timezone you set (an IANA
+        name such as Asia/Tokyo), or in the server's default timezone if you leave it empty.
       </p>
       <Form method="post" className="flex items-end gap-2 mb-6">
         <div className="flex flex-col gap-1">
@@ -238,6 +240,16 @@ export default function Settings({ loaderData }: Route.ComponentProps) {
             className="w-64"
           />
         </div>
+        <div className="flex flex-col gap-1">
+          <Label htmlFor="timezone">Reminder timezone</Label>
+          <Input
+            id="timezone"
+            name="timezone"
+            placeholder="e.g. Asia/Tokyo"
+            defaultValue={user.timezone ?? ""}
+            className="w-64"
+          />
+        </div>
         <Button type="submit">Save</Button>
       </Form>
 